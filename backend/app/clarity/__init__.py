@@ -180,6 +180,7 @@ from app.clarity.counterfactual_orchestrator import (
     RunnerProtocol,
     RunnerResult,
     StubbedRunner,
+    clear_baseline_cache,
     list_available_baselines,
     load_baseline_registry,
     load_baseline_spec,
@@ -342,6 +343,7 @@ __all__ = [
     "load_baseline_registry",
     "load_baseline_spec",
     "list_available_baselines",
+    "clear_baseline_cache",
     # Evidence Overlay (M10)
     "EvidenceMap",
     "Heatmap",
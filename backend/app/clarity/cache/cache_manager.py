@@ -12,8 +12,11 @@ CRITICAL CONSTRAINTS:
 
 from __future__ import annotations
 
+import hashlib
 import logging
+import mmap
 import os
+import re
 import tempfile
 import time
 from pathlib import Path
@@ -28,6 +31,36 @@ T = TypeVar("T", bound=bytes)
 DEFAULT_CACHE_DIR = Path(__file__).parent.parent.parent.parent.parent / ".clarity_cache"
 
 
+# Cache keys matching this pattern are used verbatim as filename stems
+_SAFE_KEY_PATTERN = re.compile(r"[A-Za-z0-9_-]{1,128}")
+
+# Prefix marking hashed stems; literal keys never start with it
+_HASHED_STEM_PREFIX = "h_"
+
+
+def _filename_stem(cache_key: str) -> str:
+    """Map a cache key to a filesystem-safe filename stem.
+
+    Short alphanumeric keys (including compute_case_hash output) are kept
+    as-is. Anything else, such as keys with path separators or very long
+    keys, is hashed with BLAKE2b to "h_" plus a 32-char hex digest. Keys
+    that already start with "h_" are hashed too, so a literal key can
+    never collide with a hashed stem.
+
+    Args:
+        cache_key: The cache key.
+
+    Returns:
+        Filename stem for the key.
+    """
+    if _SAFE_KEY_PATTERN.fullmatch(cache_key) and not cache_key.startswith(
+        _HASHED_STEM_PREFIX
+    ):
+        return cache_key
+    digest = hashlib.blake2b(cache_key.encode("utf-8"), digest_size=16).hexdigest()
+    return f"{_HASHED_STEM_PREFIX}{digest}"
+
+
 def get_cache_dir() -> Path:
     """Get the cache directory path.
 
@@ -174,7 +207,7 @@ class CacheManager:
         Returns:
             Path to the cache file.
         """
-        return self.cache_dir / f"{cache_key}{extension}"
+        return self.cache_dir / f"{_filename_stem(cache_key)}{extension}"
 
     def _lock_path(self, cache_key: str) -> Path:
         """Get the lock file path for a key.
@@ -185,7 +218,7 @@ class CacheManager:
         Returns:
             Path to the lock file.
         """
-        return self.cache_dir / f"{cache_key}.lock"
+        return self.cache_dir / f"{_filename_stem(cache_key)}.lock"
 
     def get(self, cache_key: str, extension: str = "") -> bytes | None:
         """Get cached data if it exists.
@@ -197,14 +230,46 @@ class CacheManager:
         Returns:
             Cached bytes if found, None otherwise.
         """
+        view = self.get_view(cache_key, extension)
+        if view is None:
+            return None
+
+        with view:
+            return bytes(view)
+
+    def get_view(self, cache_key: str, extension: str = "") -> memoryview | None:
+        """Get a read-only, zero-copy view of cached data if it exists.
+
+        The cache file is memory-mapped instead of read into a new bytes
+        object, so large entries (e.g., PDFs) are served from the page cache.
+        The mapping stays open for as long as the returned view is referenced.
+
+        Args:
+            cache_key: The cache key (hash).
+            extension: File extension (e.g., ".pdf").
+
+        Returns:
+            Read-only memoryview of the cached data if found, None otherwise.
+        """
         cache_path = self._cache_path(cache_key, extension)
 
-        if cache_path.exists():
-            logger.debug(f"Cache hit: {cache_key}")
-            return cache_path.read_bytes()
+        try:
+            fd = os.open(cache_path, os.O_RDONLY)
+        except FileNotFoundError:
+            logger.debug(f"Cache miss: {cache_key}")
+            return None
+
+        try:
+            # mmap cannot map an empty file
+            if os.fstat(fd).st_size == 0:
+                view = memoryview(b"")
+            else:
+                view = memoryview(mmap.mmap(fd, 0, access=mmap.ACCESS_READ))
+        finally:
+            os.close(fd)
 
-        logger.debug(f"Cache miss: {cache_key}")
-        return None
+        logger.debug(f"Cache hit: {cache_key}")
+        return view
 
     def put(self, cache_key: str, data: bytes, extension: str = "") -> Path:
         """Store data in cache with atomic write.
@@ -227,7 +292,7 @@ class CacheManager:
         # Write to temp file first
         fd, temp_path = tempfile.mkstemp(
             dir=self.cache_dir,
-            prefix=f".{cache_key}_",
+            prefix=f".{cache_path.stem}_",
             suffix=extension,
         )
         try:
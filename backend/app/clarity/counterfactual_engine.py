@@ -36,6 +36,7 @@ Masking Strategy:
 
 from __future__ import annotations
 
+import functools
 from dataclasses import dataclass
 from typing import Any
 
@@ -125,7 +126,7 @@ class RegionMask:
         }
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class CounterfactualProbe:
     """Specifies a counterfactual probe configuration.
 
@@ -163,11 +164,13 @@ class CounterfactualProbe:
         }
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ProbeResult:
     """Result of a single counterfactual probe.
 
     Contains baseline and masked metric values along with computed deltas.
+    Slotted to keep per-result memory small on large grids; values keep
+    full 8-decimal precision rather than a packed fixed-point form.
 
     Attributes:
         probe: The CounterfactualProbe that was executed.
@@ -264,11 +267,14 @@ class ProbeSurface:
         }
 
 
+@functools.lru_cache(maxsize=16)
 def generate_grid_masks(grid_size: int) -> tuple[RegionMask, ...]:
     """Generate grid-based region masks.
 
     Creates k×k uniform grid masks over normalized image coordinates.
     Each cell is identified by (row, col) with deterministic region_id.
+    Results are memoized per grid_size; the masks are frozen, so the
+    cached tuple is safe to share.
 
     Args:
         grid_size: Number of cells per dimension (e.g., 3 for 3×3 = 9 regions).
@@ -380,37 +386,65 @@ def apply_mask(
     # Create a copy to avoid mutation
     result = image.copy()
 
-    # Convert normalized coordinates to pixel coordinates
-    width, height = image.size
-
-    # Calculate pixel bounds (integer)
-    x1 = int(mask.x_min * width)
-    y1 = int(mask.y_min * height)
-    x2 = int(mask.x_max * width)
-    y2 = int(mask.y_max * height)
-
-    # Clamp to image bounds
-    x1 = max(0, min(x1, width))
-    y1 = max(0, min(y1, height))
-    x2 = max(0, min(x2, width))
-    y2 = max(0, min(y2, height))
+    x1, y1, x2, y2 = _mask_pixel_bounds(mask, *image.size)
 
     # Skip if region is empty after rounding
     if x2 <= x1 or y2 <= y1:
         return result
 
-    # Create fill color tuple (RGB)
-    fill_color = (fill_value, fill_value, fill_value)
-
-    # Fill the region using PIL's paste with a solid color image
-    region_width = x2 - x1
-    region_height = y2 - y1
-    fill_region = Image.new("RGB", (region_width, region_height), fill_color)
-    result.paste(fill_region, (x1, y1))
+    # Fill the region with a solid RGB color in a single rectangle fill
+    result.paste((fill_value, fill_value, fill_value), (x1, y1, x2, y2))
 
     return result
 
 
+def _mask_pixel_bounds(
+    mask: RegionMask,
+    width: int,
+    height: int,
+) -> tuple[int, int, int, int]:
+    """Convert a mask's normalized coordinates to clamped pixel bounds.
+
+    Args:
+        mask: RegionMask with normalized coordinates.
+        width: Image width in pixels.
+        height: Image height in pixels.
+
+    Returns:
+        (x1, y1, x2, y2) pixel bounds; the region is empty if x2 <= x1
+        or y2 <= y1.
+    """
+    x1 = max(0, min(int(mask.x_min * width), width))
+    y1 = max(0, min(int(mask.y_min * height), height))
+    x2 = max(0, min(int(mask.x_max * width), width))
+    y2 = max(0, min(int(mask.y_max * height), height))
+    return x1, y1, x2, y2
+
+
+def _apply_mask_inplace(
+    pixels: Any,
+    mask: RegionMask,
+    fill_value: int = MASK_FILL_VALUE,
+) -> None:
+    """Fill a mask region in place on a (height, width[, channels]) pixel array.
+
+    Uses the same pixel bounds as apply_mask, so callers that already hold
+    a writable array (e.g., from np.asarray(image).copy()) can reuse one
+    scratch buffer instead of allocating a new PIL image per mask. Only
+    slice assignment is used, so this module does not depend on numpy.
+
+    Args:
+        pixels: Writable array supporting 2-D slice assignment.
+        mask: RegionMask defining the region to fill.
+        fill_value: Value to write into the region (0-255).
+    """
+    height, width = pixels.shape[0], pixels.shape[1]
+    x1, y1, x2, y2 = _mask_pixel_bounds(mask, width, height)
+    if x2 <= x1 or y2 <= y1:
+        return
+    pixels[y1:y2, x1:x2] = fill_value
+
+
 def compute_probe_result(
     probe: CounterfactualProbe,
     baseline_esi: float,
@@ -36,19 +36,16 @@ Typical workflow:
 
 from __future__ import annotations
 
+import functools
 import json
+from collections.abc import Mapping
 from dataclasses import dataclass
 from pathlib import Path
+from types import MappingProxyType
 from typing import Any, Protocol
 
 from PIL import Image
 
-from app.clarity.evidence_overlay import (
-    EvidenceMap,
-    OverlayBundle,
-    create_overlay_bundle,
-    generate_stubbed_evidence_map,
-)
 from app.clarity.counterfactual_engine import (
     CounterfactualComputationError,
     CounterfactualProbe,
@@ -60,7 +57,12 @@ from app.clarity.counterfactual_engine import (
     compute_probe_surface,
     generate_grid_masks,
 )
-
+from app.clarity.evidence_overlay import (
+    EvidenceMap,
+    OverlayBundle,
+    create_overlay_bundle,
+    generate_stubbed_evidence_map,
+)
 
 # Default fixture directory relative to this module
 DEFAULT_FIXTURES_DIR = Path(__file__).parent.parent.parent / "tests" / "fixtures" / "baselines"
@@ -319,14 +321,22 @@ class StubbedRunner:
         return self._call_count
 
 
-def load_baseline_registry(fixtures_dir: Path | None = None) -> dict[str, dict[str, Any]]:
+@functools.lru_cache(maxsize=32)
+def load_baseline_registry(
+    fixtures_dir: Path | None = None,
+) -> Mapping[str, Mapping[str, Any]]:
     """Load the baseline registry from fixtures.
 
+    Results are memoized per fixtures_dir and shared between callers, so
+    the registry and each baseline's metadata are returned as read-only
+    mappings. Call clear_baseline_cache() after changing registry files
+    on disk.
+
     Args:
         fixtures_dir: Path to fixtures directory. Uses default if None.
 
     Returns:
-        Dictionary mapping baseline_id to baseline metadata.
+        Read-only mapping of baseline_id to baseline metadata.
 
     Raises:
         OrchestratorError: If registry cannot be loaded.
@@ -340,12 +350,17 @@ def load_baseline_registry(fixtures_dir: Path | None = None) -> dict[str, dict[s
         raise OrchestratorError(f"Baseline registry not found: {registry_path}")
 
     try:
-        with open(registry_path, encoding="utf-8") as f:
-            data = json.load(f)
-            return data.get("baselines", {})
+        data = json.loads(registry_path.read_bytes())
     except json.JSONDecodeError as e:
         raise OrchestratorError(f"Invalid JSON in registry: {e}") from e
 
+    return MappingProxyType(
+        {
+            baseline_id: MappingProxyType(entry)
+            for baseline_id, entry in data.get("baselines", {}).items()
+        }
+    )
+
 
 def load_baseline_spec(
     baseline_id: str,
@@ -353,6 +368,33 @@ def load_baseline_spec(
 ) -> BaselineSpec:
     """Load a baseline specification by ID.
 
+    Parsed specs are memoized per (baseline_id, fixtures_dir); see
+    clear_baseline_cache(). The image file is still checked on every call,
+    since the orchestrator opens it afterwards.
+
+    Args:
+        baseline_id: The baseline identifier.
+        fixtures_dir: Path to fixtures directory. Uses default if None.
+
+    Returns:
+        BaselineSpec with loaded data.
+
+    Raises:
+        OrchestratorError: If baseline not found or invalid.
+    """
+    spec = _load_baseline_spec(baseline_id, fixtures_dir)
+    if not spec.image_path.exists():
+        raise OrchestratorError(f"Image file not found: {spec.image_path}")
+    return spec
+
+
+@functools.lru_cache(maxsize=32)
+def _load_baseline_spec(
+    baseline_id: str,
+    fixtures_dir: Path | None,
+) -> BaselineSpec:
+    """Load and parse a baseline spec (memoized; see load_baseline_spec).
+
     Args:
         baseline_id: The baseline identifier.
         fixtures_dir: Path to fixtures directory. Uses default if None.
@@ -390,8 +432,7 @@ def load_baseline_spec(
         raise OrchestratorError(f"Image file not found: {image_path}")
 
     try:
-        with open(spec_path, encoding="utf-8") as f:
-            spec_data = json.load(f)
+        spec_data = json.loads(spec_path.read_bytes())
     except json.JSONDecodeError as e:
         raise OrchestratorError(f"Invalid JSON in spec: {e}") from e
 
@@ -407,6 +448,27 @@ def load_baseline_spec(
     )
 
 
+def clear_baseline_cache() -> None:
+    """Drop memoized registry and spec loads.
+
+    Needed only when fixture files change on disk while the process runs.
+    """
+    load_baseline_registry.cache_clear()
+    _load_baseline_spec.cache_clear()
+    _sorted_baseline_ids.cache_clear()
+
+
+@functools.lru_cache(maxsize=8)
+def _sorted_baseline_ids(fixtures_dir: Path | None) -> tuple[str, ...]:
+    """Return registry baseline IDs, sorted once per successful registry load.
+
+    Raises:
+        OrchestratorError: If the registry is missing or invalid. Failures
+            are not cached, so a registry written later is picked up.
+    """
+    return tuple(sorted(load_baseline_registry(fixtures_dir)))
+
+
 def list_available_baselines(fixtures_dir: Path | None = None) -> list[str]:
     """List all available baseline IDs.
 
@@ -414,11 +476,11 @@ def list_available_baselines(fixtures_dir: Path | None = None) -> list[str]:
         fixtures_dir: Path to fixtures directory. Uses default if None.
 
     Returns:
-        Sorted list of baseline IDs.
+        Sorted list of baseline IDs (a fresh list; the sort is memoized),
+        or an empty list if the registry is missing or invalid.
     """
     try:
-        registry = load_baseline_registry(fixtures_dir)
-        return sorted(registry.keys())
+        return list(_sorted_baseline_ids(fixtures_dir))
     except OrchestratorError:
         return []
 
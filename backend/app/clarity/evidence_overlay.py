@@ -3,7 +3,7 @@
 This module provides evidence visualization capabilities including:
 - Evidence maps from model outputs
 - Normalized heatmaps for visualization
-- Region extraction via threshold + BFS for CF-001 closure
+- Region extraction via threshold + run-length labelling for CF-001 closure
 
 CRITICAL CONSTRAINTS (M10):
 1. All computation must be deterministic given identical inputs.
@@ -11,7 +11,7 @@ CRITICAL CONSTRAINTS (M10):
 3. No subprocess.
 4. No direct r2l imports.
 5. All floats rounded to 8 decimal places at storage.
-6. Deterministic BFS traversal (row-major order).
+6. Deterministic component labelling (row-major order).
 7. Frozen dataclasses only.
 8. Region sorting: (area desc, x asc, y asc).
 9. Fixed threshold = 0.7 for region extraction.
@@ -20,22 +20,31 @@ CRITICAL CONSTRAINTS (M10):
 The module provides:
 - EvidenceMap: Raw evidence values from runner
 - Heatmap: Normalized 2D float matrix [0,1]
-- OverlayRegion: Bounding box from threshold + BFS
+- OverlayRegion: Bounding box of a 4-connected above-threshold component
 - OverlayBundle: Complete overlay data for API response
 """
 
 from __future__ import annotations
 
+import functools
 import math
-from dataclasses import dataclass
+from array import array
+from dataclasses import InitVar, dataclass, field
+from itertools import chain
 from typing import Any
 
+import numpy as np
+
 
 # Fixed constants for M10
 EVIDENCE_THRESHOLD: float = 0.7
 DEFAULT_EVIDENCE_WIDTH: int = 224
 DEFAULT_EVIDENCE_HEIGHT: int = 224
 
+# The stub pattern only depends on seed % 2, seed % 3 and seed % 4, so it
+# repeats every 12 seeds
+_STUB_SEED_PERIOD: int = 12
+
 
 class EvidenceOverlayError(Exception):
     """Raised when evidence overlay computation fails.
@@ -61,7 +70,64 @@ def _round8(value: float) -> float:
     return round(value, 8)
 
 
-@dataclass(frozen=True)
+def _round8_array(arr: np.ndarray) -> np.ndarray:
+    """Round every element to 8 decimal places, matching _round8 exactly.
+
+    rint(x * 1e8) / 1e8 agrees with round(x, 8) unless the scaled product is
+    within its own rounding error of a .5 tie (or too large to carry a
+    fraction); those few cells are redone with _round8.
+
+    Args:
+        arr: Float64 array to round.
+
+    Returns:
+        New array of rounded values.
+    """
+    with np.errstate(invalid="ignore"):
+        scaled = arr * 1e8
+        out = np.rint(scaled) / 1e8
+        frac = np.abs(scaled - np.trunc(scaled))
+        exact = (np.abs(frac - 0.5) > np.abs(scaled) * 4.5e-16) & (
+            np.abs(scaled) < 2.0**52
+        )
+    redo = np.nonzero(~exact)
+    if redo[0].size:
+        out[redo] = [_round8(v) for v in arr[redo].tolist()]
+    return out
+
+
+def _flatten_values(values: tuple[tuple[float, ...], ...]) -> array[float]:
+    """Pack row-major nested values into one contiguous float64 buffer."""
+    return array("d", chain.from_iterable(values))
+
+
+def _pack_array(arr: np.ndarray) -> array[float]:
+    """Pack a 2D float64 array into a row-major buffer with a single copy."""
+    packed = array("d")
+    packed.frombytes(np.ascontiguousarray(arr, dtype=np.float64).data.cast("B"))
+    return packed
+
+
+def _check_packed(packed: array[float], width: int, height: int) -> None:
+    """Reject a producer-supplied buffer whose size does not match the map.
+
+    Raises:
+        EvidenceOverlayError: If the buffer length is not width * height.
+    """
+    if len(packed) != width * height:
+        raise EvidenceOverlayError(
+            f"Packed buffer size mismatch: expected {width * height}, got {len(packed)}"
+        )
+
+
+def _buffer_view(data: array[float], height: int, width: int) -> np.ndarray:
+    """Return a read-only (height, width) NumPy view of a packed buffer."""
+    view = np.frombuffer(data, dtype=np.float64).reshape(height, width)
+    view.flags.writeable = False
+    return view
+
+
+@dataclass(frozen=True, slots=True)
 class EvidenceMap:
     """Raw evidence values from model inference.
 
@@ -85,9 +151,16 @@ class EvidenceMap:
     width: int
     height: int
     values: tuple[tuple[float, ...], ...]
+    _data: array[float] = field(init=False, repr=False, compare=False)
+    _packed: InitVar[array[float] | None] = None
+
+    def __post_init__(self, _packed: array[float] | None) -> None:
+        """Validate evidence map dimensions and pack the values.
 
-    def __post_init__(self) -> None:
-        """Validate evidence map dimensions."""
+        Producers that already hold the values as an array pass _packed
+        (from _pack_array) so the nested tuples are not walked again; it
+        must hold the same values as values, in row-major order.
+        """
         if self.width < 1 or self.height < 1:
             raise EvidenceOverlayError(
                 f"Invalid dimensions: width={self.width}, height={self.height}"
@@ -101,6 +174,21 @@ class EvidenceMap:
                 raise EvidenceOverlayError(
                     f"Row {row_idx} width mismatch: expected {self.width}, got {len(row)}"
                 )
+        if _packed is None:
+            _packed = _flatten_values(self.values)
+        else:
+            _check_packed(_packed, self.width, self.height)
+        object.__setattr__(self, "_data", _packed)
+
+    def as_array(self) -> np.ndarray:
+        """Return the values as a read-only (height, width) float64 array.
+
+        The array is a zero-copy view of a float64 buffer packed at
+        construction. That buffer is an extra copy of values (8 bytes per
+        cell), kept so vectorized consumers don't rebuild it from the
+        nested tuples; values remains the serialized field.
+        """
+        return _buffer_view(self._data, self.height, self.width)
 
     def to_dict(self) -> dict[str, Any]:
         """Convert to dictionary representation.
@@ -115,7 +203,7 @@ class EvidenceMap:
         }
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Heatmap:
     """Normalized heatmap for visualization.
 
@@ -139,9 +227,16 @@ class Heatmap:
     width: int
     height: int
     values: tuple[tuple[float, ...], ...]
+    _data: array[float] = field(init=False, repr=False, compare=False)
+    _packed: InitVar[array[float] | None] = None
+
+    def __post_init__(self, _packed: array[float] | None) -> None:
+        """Validate heatmap dimensions and pack the values.
 
-    def __post_init__(self) -> None:
-        """Validate heatmap dimensions and value ranges."""
+        Producers that already hold the values as an array pass _packed
+        (from _pack_array) so the nested tuples are not walked again; it
+        must hold the same values as values, in row-major order.
+        """
         if self.width < 1 or self.height < 1:
             raise EvidenceOverlayError(
                 f"Invalid dimensions: width={self.width}, height={self.height}"
@@ -155,6 +250,21 @@ class Heatmap:
                 raise EvidenceOverlayError(
                     f"Row {row_idx} width mismatch: expected {self.width}, got {len(row)}"
                 )
+        if _packed is None:
+            _packed = _flatten_values(self.values)
+        else:
+            _check_packed(_packed, self.width, self.height)
+        object.__setattr__(self, "_data", _packed)
+
+    def as_array(self) -> np.ndarray:
+        """Return the values as a read-only (height, width) float64 array.
+
+        The array is a zero-copy view of a float64 buffer packed at
+        construction. That buffer is an extra copy of values (8 bytes per
+        cell), kept so vectorized consumers don't rebuild it from the
+        nested tuples; values remains the serialized field.
+        """
+        return _buffer_view(self._data, self.height, self.width)
 
     def to_dict(self) -> dict[str, Any]:
         """Convert to dictionary representation.
@@ -169,7 +279,7 @@ class Heatmap:
         }
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class OverlayRegion:
     """A region extracted from evidence map via thresholding.
 
@@ -203,6 +313,9 @@ class OverlayRegion:
     def to_dict(self) -> dict[str, Any]:
         """Convert to dictionary representation.
 
+        Keys are written in alphabetical order directly, so no sort runs
+        per call.
+
         Returns:
             Dictionary with all attributes in alphabetical key order.
         """
@@ -223,7 +336,7 @@ class OverlayBundle:
     Contains all visualization data needed by the frontend:
     - Evidence map (raw values)
     - Heatmap (normalized for colormap)
-    - Regions (bounding boxes from threshold + BFS)
+    - Regions (bounding boxes from threshold + run-length labelling)
 
     Attributes:
         evidence_map: The raw evidence map from inference.
@@ -285,6 +398,17 @@ def generate_stubbed_evidence_map(
             f"Invalid dimensions: width={width}, height={height}"
         )
 
+    return _stubbed_evidence_map(width, height, seed % _STUB_SEED_PERIOD)
+
+
+@functools.lru_cache(maxsize=_STUB_SEED_PERIOD)
+def _stubbed_evidence_map(width: int, height: int, seed: int) -> EvidenceMap:
+    """Build the stubbed evidence map for a seed already reduced by the period.
+
+    EvidenceMap is immutable, so one instance per (width, height, pattern)
+    is shared by every caller. The cache holds one seed period of maps
+    (about 2 MB each at the default 224x224), which bounds what it pins.
+    """
     # Fixed bump parameters based on seed
     # Use simple deterministic formulas to vary positions
     bump_count = 2 + (seed % 2)  # 2 or 3 bumps
@@ -305,35 +429,28 @@ def generate_stubbed_evidence_map(
 
         bumps.append((cx, cy, sigma))
 
-    # Generate values
-    rows: list[tuple[float, ...]] = []
-
-    for y in range(height):
-        row: list[float] = []
-        ny = y / (height - 1) if height > 1 else 0.5
+    # Normalized pixel coordinates along each axis
+    ny = np.arange(height) / (height - 1) if height > 1 else np.array([0.5])
+    nx = np.arange(width) / (width - 1) if width > 1 else np.array([0.5])
 
-        for x in range(width):
-            nx = x / (width - 1) if width > 1 else 0.5
+    # Sum Gaussian contributions from all bumps over the whole grid, in the
+    # same operation order as the per-pixel formula
+    value = np.zeros((height, width))
+    for cx, cy, sigma in bumps:
+        dx = nx - cx
+        dy = ny - cy
+        dist_sq = (dx * dx)[np.newaxis, :] + (dy * dy)[:, np.newaxis]
+        # Gaussian formula: exp(-dist^2 / (2 * sigma^2))
+        value += np.exp(-dist_sq / (2 * sigma * sigma))
 
-            # Sum Gaussian contributions from all bumps
-            value = 0.0
-            for cx, cy, sigma in bumps:
-                dx = nx - cx
-                dy = ny - cy
-                dist_sq = dx * dx + dy * dy
-                # Gaussian formula: exp(-dist^2 / (2 * sigma^2))
-                value += math.exp(-dist_sq / (2 * sigma * sigma))
-
-            # Clamp to [0, 1] and round
-            value = _round8(max(0.0, min(1.0, value)))
-            row.append(value)
-
-        rows.append(tuple(row))
+    # Clamp to [0, 1] and round
+    rounded = _round8_array(np.clip(value, 0.0, 1.0))
 
     return EvidenceMap(
         width=width,
         height=height,
-        values=tuple(rows),
+        values=tuple(map(tuple, rounded.tolist())),
+        _packed=_pack_array(rounded),
     )
 
 
@@ -357,40 +474,126 @@ def normalize_evidence_to_heatmap(evidence: EvidenceMap) -> Heatmap:
         >>> all(0 <= v <= 1 for row in heatmap.values for v in row)
         True
     """
-    # Find min and max values
-    min_val = float("inf")
-    max_val = float("-inf")
-
-    for row in evidence.values:
-        for value in row:
-            if not math.isfinite(value):
-                raise EvidenceOverlayError(f"Non-finite value in evidence map: {value}")
-            if value < min_val:
-                min_val = value
-            if value > max_val:
-                max_val = value
+    arr = evidence.as_array()
+
+    # NaN propagates through min/max and +/-inf would be the min or max, so
+    # finite extremes prove every value is finite without a separate scan
+    min_val = float(arr.min())
+    max_val = float(arr.max())
+    if not (math.isfinite(min_val) and math.isfinite(max_val)):
+        # Report the first offending value in row-major order
+        y, x = np.argwhere(~np.isfinite(arr))[0]
+        raise EvidenceOverlayError(
+            f"Non-finite value in evidence map: {evidence.values[y][x]}"
+        )
 
     # Handle edge case where all values are the same
     value_range = max_val - min_val
     if value_range < 1e-10:
         # All values are essentially the same
         # Return a constant heatmap (0.5 if there were values, or 0.0)
-        const_val = 0.5 if max_val > 0 else 0.0
-        normalized_rows = tuple(
-            tuple(_round8(const_val) for _ in row)
-            for row in evidence.values
-        )
-    else:
-        # Min-max normalize
-        normalized_rows = tuple(
-            tuple(_round8((v - min_val) / value_range) for v in row)
-            for row in evidence.values
+        const_row = (_round8(0.5 if max_val > 0 else 0.0),) * evidence.width
+        return Heatmap(
+            width=evidence.width,
+            height=evidence.height,
+            values=(const_row,) * evidence.height,
         )
 
+    # Min-max normalize and round in array passes; float64 arithmetic
+    # matches the scalar expression exactly
+    scaled = _round8_array((arr - min_val) / value_range)
+
     return Heatmap(
         width=evidence.width,
         height=evidence.height,
-        values=normalized_rows,
+        values=tuple(map(tuple, scaled.tolist())),
+        _packed=_pack_array(scaled),
+    )
+
+
+def _component_bounding_boxes(
+    mask: np.ndarray,
+) -> list[tuple[int, int, int, int]]:
+    """Find 4-connected components of a boolean mask.
+
+    The mask is split into horizontal runs with one vectorized diff, and
+    runs that overlap a run on the previous row are merged with union-find.
+    Only the runs are visited in Python, not every pixel.
+
+    Args:
+        mask: 2D boolean array (height, width).
+
+    Returns:
+        Inclusive pixel bounding boxes (min_x, min_y, max_x, max_y), one per
+        component, ordered by the component's first pixel in row-major order.
+    """
+    height, width = mask.shape
+    padded = np.zeros((height, width + 2), dtype=np.int8)
+    padded[:, 1:-1] = mask
+    edges = np.diff(padded, axis=1)
+
+    # Runs in row-major order: row, start column, exclusive end column
+    run_rows, run_starts = (idx.tolist() for idx in np.nonzero(edges == 1))
+    run_ends = np.nonzero(edges == -1)[1].tolist()
+    run_count = len(run_rows)
+
+    parent = list(range(run_count))
+
+    def find(run: int) -> int:
+        while parent[run] != run:
+            parent[run] = parent[parent[run]]
+            run = parent[run]
+        return run
+
+    # Merge runs with column overlap on consecutive rows. The root is always
+    # the lowest run index, i.e. the component's first run in row-major order.
+    prev_begin = prev_end = 0
+    begin = 0
+    while begin < run_count:
+        row = run_rows[begin]
+        end = begin
+        while end < run_count and run_rows[end] == row:
+            end += 1
+
+        if prev_end > prev_begin and run_rows[prev_begin] == row - 1:
+            i, j = prev_begin, begin
+            while i < prev_end and j < end:
+                if run_starts[i] < run_ends[j] and run_starts[j] < run_ends[i]:
+                    root_i, root_j = find(i), find(j)
+                    if root_i < root_j:
+                        parent[root_j] = root_i
+                    elif root_j < root_i:
+                        parent[root_i] = root_j
+                # Advance whichever run finishes first
+                if run_ends[i] < run_ends[j]:
+                    i += 1
+                else:
+                    j += 1
+
+        prev_begin, prev_end = begin, end
+        begin = end
+
+    if run_count == 0:
+        return []
+
+    # Group runs by component with one stable sort, then reduce each group's
+    # extents in a single reduceat per bound. Roots are each component's
+    # lowest run index, so sorting by root keeps first-appearance order.
+    roots = np.fromiter(map(find, range(run_count)), dtype=np.intp, count=run_count)
+    order = np.argsort(roots, kind="stable")
+    sorted_roots = roots[order]
+    group_starts = np.flatnonzero(np.r_[True, sorted_roots[1:] != sorted_roots[:-1]])
+
+    rows = np.asarray(run_rows, dtype=np.intp)[order]
+    min_x = np.minimum.reduceat(np.asarray(run_starts, dtype=np.intp)[order], group_starts)
+    max_x = np.maximum.reduceat(np.asarray(run_ends, dtype=np.intp)[order], group_starts) - 1
+    # Runs are in row-major order, so each group's first and last runs hold
+    # its top and bottom rows
+    min_y = rows[group_starts]
+    max_y = np.maximum.reduceat(rows, group_starts)
+
+    return list(
+        zip(min_x.tolist(), min_y.tolist(), max_x.tolist(), max_y.tolist(), strict=True)
     )
 
 
@@ -398,10 +601,10 @@ def extract_regions_from_heatmap(
     heatmap: Heatmap,
     threshold: float = EVIDENCE_THRESHOLD,
 ) -> tuple[OverlayRegion, ...]:
-    """Extract connected regions from heatmap via threshold + BFS.
+    """Extract connected regions from heatmap via threshold + labelling.
 
-    Performs thresholding to find pixels above threshold, then uses
-    deterministic BFS (row-major order) to find connected components.
+    Performs thresholding to find pixels above threshold, then labels
+    4-connected components deterministically (row-major order).
     Each component becomes an OverlayRegion with a bounding box.
 
     Args:
@@ -422,57 +625,13 @@ def extract_regions_from_heatmap(
     height = heatmap.height
     width = heatmap.width
 
-    # Create binary mask of above-threshold pixels
-    above_threshold: list[list[bool]] = []
-    for row in heatmap.values:
-        above_threshold.append([v > threshold for v in row])
-
-    # Track visited pixels
-    visited: list[list[bool]] = [[False] * width for _ in range(height)]
-
-    # Find connected components via BFS (row-major order)
-    components: list[list[tuple[int, int]]] = []
-
-    for start_y in range(height):
-        for start_x in range(width):
-            if above_threshold[start_y][start_x] and not visited[start_y][start_x]:
-                # Start BFS from this pixel
-                component: list[tuple[int, int]] = []
-                queue: list[tuple[int, int]] = [(start_x, start_y)]
-                visited[start_y][start_x] = True
-
-                while queue:
-                    x, y = queue.pop(0)
-                    component.append((x, y))
-
-                    # Check 4-connected neighbors (row-major order for determinism)
-                    # Order: up, left, right, down
-                    neighbors = [
-                        (x, y - 1),  # up
-                        (x - 1, y),  # left
-                        (x + 1, y),  # right
-                        (x, y + 1),  # down
-                    ]
-
-                    for nx, ny in neighbors:
-                        if 0 <= nx < width and 0 <= ny < height:
-                            if above_threshold[ny][nx] and not visited[ny][nx]:
-                                visited[ny][nx] = True
-                                queue.append((nx, ny))
-
-                if component:
-                    components.append(component)
-
-    # Convert components to OverlayRegions
-    regions: list[OverlayRegion] = []
-
-    for idx, component in enumerate(components):
-        # Find bounding box
-        min_x = min(p[0] for p in component)
-        max_x = max(p[0] for p in component)
-        min_y = min(p[1] for p in component)
-        max_y = max(p[1] for p in component)
+    # Binary mask of above-threshold pixels
+    mask = heatmap.as_array() > threshold
 
+    # (x_min, y_min, x_max, y_max, area) per component, in discovery order
+    boxes: list[tuple[float, float, float, float, float]] = []
+
+    for min_x, min_y, max_x, max_y in _component_bounding_boxes(mask):
         # Convert to normalized coordinates
         # Use (pixel + 0.5) / dimension for center-based normalization
         # But for bounding boxes, use pixel edges
@@ -490,39 +649,25 @@ def extract_regions_from_heatmap(
         # Compute area
         area = _round8((x_max - x_min) * (y_max - y_min))
 
-        regions.append(
-            OverlayRegion(
-                region_id=f"evidence_r{idx}",
-                x_min=x_min,
-                y_min=y_min,
-                x_max=x_max,
-                y_max=y_max,
-                area=area,
-            )
+        boxes.append((x_min, y_min, x_max, y_max, area))
+
+    # Sort by (area desc, x_min asc, y_min asc); the sort is stable, so ties
+    # keep discovery order
+    boxes.sort(key=lambda box: (-box[4], box[0], box[1]))
+
+    # Assign region IDs in sorted order, building each region once
+    return tuple(
+        OverlayRegion(
+            region_id=f"evidence_r{idx}",
+            x_min=x_min,
+            y_min=y_min,
+            x_max=x_max,
+            y_max=y_max,
+            area=area,
         )
-
-    # Sort by (area desc, x_min asc, y_min asc)
-    sorted_regions = sorted(
-        regions,
-        key=lambda r: (-r.area, r.x_min, r.y_min),
+        for idx, (x_min, y_min, x_max, y_max, area) in enumerate(boxes)
     )
 
-    # Re-assign region IDs after sorting
-    final_regions: list[OverlayRegion] = []
-    for idx, region in enumerate(sorted_regions):
-        final_regions.append(
-            OverlayRegion(
-                region_id=f"evidence_r{idx}",
-                x_min=region.x_min,
-                y_min=region.y_min,
-                x_max=region.x_max,
-                y_max=region.y_max,
-                area=region.area,
-            )
-        )
-
-    return tuple(final_regions)
-
 
 def create_overlay_bundle(
     evidence: EvidenceMap,
@@ -532,7 +677,7 @@ def create_overlay_bundle(
 
     Performs full pipeline:
     1. Normalize evidence to heatmap
-    2. Extract regions via threshold + BFS
+    2. Extract regions via threshold + run-length labelling (union-find)
     3. Bundle everything for API response
 
     Args:
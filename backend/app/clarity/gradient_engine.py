@@ -31,6 +31,7 @@ Gradient Computation:
 from __future__ import annotations
 
 import math
+from collections.abc import Sequence
 from dataclasses import dataclass
 from typing import Any
 
@@ -61,7 +62,46 @@ def _round8(value: float) -> float:
     return round(value, 8)
 
 
-@dataclass(frozen=True)
+def _round8_series(values: list[float]) -> list[float]:
+    """Round a series of values to 8 decimal places in one pass.
+
+    Equivalent to mapping _round8, without a Python call frame per value.
+
+    Args:
+        values: The float values to round.
+
+    Returns:
+        The values rounded to 8 decimal places, in input order.
+    """
+    return [round(v, 8) for v in values]
+
+
+def _finite_differences(values: Sequence[float]) -> list[float]:
+    """Compute finite-difference gradients for one axis series.
+
+    Applies the forward/central/backward stencil over whole slices rather
+    than branching per point:
+    - Single value: [0.0]
+    - Two values: the same difference at both endpoints
+    - N >= 3: forward at i=0, (f[i+1] - f[i-1]) / 2 inside, backward at i=n-1
+
+    Args:
+        values: ESI or Drift values in axis value order.
+
+    Returns:
+        Unrounded gradients, one per input value.
+    """
+    n = len(values)
+    if n < 2:
+        return [0.0] * n
+    first = values[1] - values[0]
+    if n == 2:
+        return [first, first]
+    interior = [(values[i + 1] - values[i - 1]) / 2 for i in range(1, n - 1)]
+    return [first, *interior, values[-1] - values[-2]]
+
+
+@dataclass(frozen=True, slots=True)
 class GradientPoint:
     """Single gradient point on a robustness surface.
 
@@ -251,7 +291,8 @@ class GradientEngine:
 
         # Process each axis (already in alphabetical order from M06)
         axis_gradients: list[AxisGradient] = []
-        all_gradient_points: list[GradientPoint] = []
+        all_abs_esi: list[float] = []
+        all_abs_drift: list[float] = []
 
         for axis_surface in surface.axes:
             # Validate surface values
@@ -259,16 +300,24 @@ class GradientEngine:
 
             # Compute gradients for this axis
             gradient_points = self._compute_axis_gradients(axis_surface)
-            all_gradient_points.extend(gradient_points)
+
+            # Absolute gradients are taken once and shared by the axis and
+            # global statistics
+            abs_esi = [abs(gp.d_esi) for gp in gradient_points]
+            abs_drift = [abs(gp.d_drift) for gp in gradient_points]
+            all_abs_esi.extend(abs_esi)
+            all_abs_drift.extend(abs_drift)
 
             # Compute axis-level statistics
             axis_gradient = self._compute_axis_statistics(
-                axis_surface.axis, gradient_points
+                axis_surface.axis, gradient_points, abs_esi, abs_drift
             )
             axis_gradients.append(axis_gradient)
 
         # Compute global statistics
-        global_stats = self._compute_global_statistics(all_gradient_points)
+        global_stats = self._compute_global_statistics(
+            axis_gradients, all_abs_esi, all_abs_drift
+        )
 
         return GradientSurface(
             axes=tuple(axis_gradients),
@@ -287,6 +336,14 @@ class GradientEngine:
         Raises:
             GradientComputationError: If any ESI or Drift value is NaN/inf.
         """
+        # A sum is finite only if every term is, so one C-level reduction per
+        # column clears valid axes; the per-point scan below only runs to
+        # locate the offending value (or when finite values overflow the sum)
+        if math.isfinite(sum(axis_surface.esi_values)) and math.isfinite(
+            sum(axis_surface.drift_values)
+        ):
+            return
+
         for point in axis_surface.points:
             if not math.isfinite(point.esi):
                 raise GradientComputationError(
@@ -316,69 +373,46 @@ class GradientEngine:
             List of GradientPoint objects in value order.
         """
         points = axis_surface.points
-        n = len(points)
         axis_name = axis_surface.axis
 
-        gradient_points: list[GradientPoint] = []
-
-        for i, point in enumerate(points):
-            if n == 1:
-                # Single-value axis: zero gradient
-                d_esi = 0.0
-                d_drift = 0.0
-            elif n == 2:
-                # Two-point axis: simple difference (same for both endpoints)
-                d_esi = points[1].esi - points[0].esi
-                d_drift = points[1].drift - points[0].drift
-            else:
-                # N >= 3: use appropriate difference formula
-                if i == 0:
-                    # Forward difference for first point
-                    d_esi = points[1].esi - points[0].esi
-                    d_drift = points[1].drift - points[0].drift
-                elif i == n - 1:
-                    # Backward difference for last point
-                    d_esi = points[n - 1].esi - points[n - 2].esi
-                    d_drift = points[n - 1].drift - points[n - 2].drift
-                else:
-                    # Central difference for interior points
-                    d_esi = (points[i + 1].esi - points[i - 1].esi) / 2
-                    d_drift = (points[i + 1].drift - points[i - 1].drift) / 2
-
-            gradient_points.append(
-                GradientPoint(
-                    axis=axis_name,
-                    value=point.value,
-                    d_esi=_round8(d_esi),
-                    d_drift=_round8(d_drift),
-                )
-            )
+        d_esi = _round8_series(_finite_differences(axis_surface.esi_values))
+        d_drift = _round8_series(_finite_differences(axis_surface.drift_values))
 
-        return gradient_points
+        return [
+            GradientPoint(
+                axis=axis_name,
+                value=point.value,
+                d_esi=g_esi,
+                d_drift=g_drift,
+            )
+            for point, g_esi, g_drift in zip(points, d_esi, d_drift, strict=True)
+        ]
 
     def _compute_axis_statistics(
-        self, axis_name: str, gradient_points: list[GradientPoint]
+        self,
+        axis_name: str,
+        gradient_points: list[GradientPoint],
+        abs_esi: list[float],
+        abs_drift: list[float],
     ) -> AxisGradient:
         """Compute axis-level gradient statistics.
 
         Args:
             axis_name: Name of the axis.
             gradient_points: List of GradientPoint objects for this axis.
+            abs_esi: Absolute ESI gradients, in gradient_points order.
+            abs_drift: Absolute Drift gradients, in gradient_points order.
 
         Returns:
             AxisGradient with computed statistics.
         """
         n = len(gradient_points)
 
-        # Collect absolute gradients
-        abs_esi_grads = [abs(gp.d_esi) for gp in gradient_points]
-        abs_drift_grads = [abs(gp.d_drift) for gp in gradient_points]
-
         # Compute mean and max
-        mean_abs_esi = sum(abs_esi_grads) / n
-        max_abs_esi = max(abs_esi_grads)
-        mean_abs_drift = sum(abs_drift_grads) / n
-        max_abs_drift = max(abs_drift_grads)
+        mean_abs_esi = sum(abs_esi) / n
+        max_abs_esi = max(abs_esi)
+        mean_abs_drift = sum(abs_drift) / n
+        max_abs_drift = max(abs_drift)
 
         return AxisGradient(
             axis=axis_name,
@@ -390,27 +424,31 @@ class GradientEngine:
         )
 
     def _compute_global_statistics(
-        self, all_gradient_points: list[GradientPoint]
+        self,
+        axis_gradients: list[AxisGradient],
+        abs_esi: list[float],
+        abs_drift: list[float],
     ) -> dict[str, float]:
         """Compute global gradient statistics across all points.
 
+        Global maxima are the maxima of the per-axis maxima, which are
+        already rounded absolute gradients; only the means need every value.
+
         Args:
-            all_gradient_points: List of all GradientPoint objects.
+            axis_gradients: AxisGradient objects for all axes, in axis order.
+            abs_esi: Absolute ESI gradients of all axes, in axis order.
+            abs_drift: Absolute Drift gradients of all axes, in axis order.
 
         Returns:
             Dictionary with mean_abs_esi, max_abs_esi, mean_abs_drift, max_abs_drift.
         """
-        n = len(all_gradient_points)
-
-        # Collect absolute gradients
-        abs_esi_grads = [abs(gp.d_esi) for gp in all_gradient_points]
-        abs_drift_grads = [abs(gp.d_drift) for gp in all_gradient_points]
+        n = len(abs_esi)
 
         # Compute mean and max
-        mean_abs_esi = sum(abs_esi_grads) / n
-        max_abs_esi = max(abs_esi_grads)
-        mean_abs_drift = sum(abs_drift_grads) / n
-        max_abs_drift = max(abs_drift_grads)
+        mean_abs_esi = sum(abs_esi) / n
+        max_abs_esi = max(ag.max_abs_esi_gradient for ag in axis_gradients)
+        mean_abs_drift = sum(abs_drift) / n
+        max_abs_drift = max(ag.max_abs_drift_gradient for ag in axis_gradients)
 
         return {
             "mean_abs_esi": _round8(mean_abs_esi),
@@ -418,4 +456,3 @@ class GradientEngine:
             "mean_abs_drift": _round8(mean_abs_drift),
             "max_abs_drift": _round8(max_abs_drift),
         }
-
@@ -376,18 +376,20 @@ def generate_report(request: ReportGenerateRequest) -> Response:
             report = load_demo_case(request.case_id)
             return render_report_to_pdf(report)
 
-        # Get from cache or generate (M12)
-        pdf_bytes = cache.get_or_create(
-            cache_key=cache_key,
-            generator=generate_pdf,
-            extension=".pdf",
-        )
+        # Serve a cache hit as a zero-copy view; otherwise generate (M12)
+        pdf_content: bytes | memoryview | None = cache.get_view(cache_key, extension=".pdf")
+        if pdf_content is None:
+            pdf_content = cache.get_or_create(
+                cache_key=cache_key,
+                generator=generate_pdf,
+                extension=".pdf",
+            )
 
         logger.debug(f"Report served for case: {request.case_id}, cache_key: {cache_key[:16]}...")
 
         # Return as PDF response
         return Response(
-            content=pdf_bytes,
+            content=pdf_content,
             media_type="application/pdf",
             headers={
                 "Content-Disposition": f'attachment; filename="clarity_report_{request.case_id}.pdf"',
@@ -27,6 +27,7 @@ Structures defined:
 
 from __future__ import annotations
 
+import functools
 from dataclasses import dataclass
 from typing import Any
 
@@ -131,6 +132,20 @@ class AxisSurface:
     variance_esi: float
     variance_drift: float
 
+    @functools.cached_property
+    def esi_values(self) -> tuple[float, ...]:
+        """ESI of each point, in point order.
+
+        Built on first access and then reused; not a dataclass field, so it
+        does not affect equality, hashing or to_dict().
+        """
+        return tuple(p.esi for p in self.points)
+
+    @functools.cached_property
+    def drift_values(self) -> tuple[float, ...]:
+        """Drift of each point, in point order (built once, like esi_values)."""
+        return tuple(p.drift for p in self.points)
+
     def to_dict(self) -> dict[str, Any]:
         """Convert to dictionary representation.
 
@@ -10,6 +10,7 @@ Endpoints:
 from typing import Any
 
 from fastapi import APIRouter, HTTPException
+from fastapi.responses import Response
 from pydantic import BaseModel, Field
 
 from app.clarity import (
@@ -19,6 +20,7 @@ from app.clarity import (
     StubbedRunner,
     list_available_baselines,
 )
+from app.json_codec import SortedJSONResponse
 
 
 router = APIRouter(prefix="/counterfactual", tags=["counterfactual"])
@@ -65,7 +67,7 @@ class BaselinesResponse(BaseModel):
 
 
 @router.post("/run", response_model=CounterfactualRunResponse)
-def run_counterfactual(request: CounterfactualRunRequest) -> CounterfactualRunResponse:
+def run_counterfactual(request: CounterfactualRunRequest) -> Response:
     """Execute a counterfactual sweep.
 
     This endpoint:
@@ -74,11 +76,15 @@ def run_counterfactual(request: CounterfactualRunRequest) -> CounterfactualRunRe
     3. Runs probes (stubbed for now)
     4. Returns the probe surface
 
+    The result dict is already JSON-native, so it is serialized once here
+    rather than re-validated through CounterfactualRunResponse (which is
+    kept as the documented response schema).
+
     Args:
         request: The counterfactual run request.
 
     Returns:
-        CounterfactualRunResponse with probe results.
+        JSON response matching CounterfactualRunResponse.
 
     Raises:
         HTTPException: If orchestration fails.
@@ -99,15 +105,7 @@ def run_counterfactual(request: CounterfactualRunRequest) -> CounterfactualRunRe
     except CounterfactualComputationError as e:
         raise HTTPException(status_code=400, detail=str(e)) from e
 
-    result_dict = result.to_dict()
-
-    return CounterfactualRunResponse(
-        baseline_id=result_dict["baseline_id"],
-        config=result_dict["config"],
-        baseline_metrics=result_dict["baseline_metrics"],
-        probe_surface=result_dict["probe_surface"],
-        overlay_bundle=result_dict["overlay_bundle"],
-    )
+    return SortedJSONResponse(result.to_dict())
 
 
 @router.get("/baselines", response_model=BaselinesResponse)
@@ -117,6 +115,5 @@ def get_baselines() -> BaselinesResponse:
     Returns:
         BaselinesResponse with list of baseline IDs.
     """
-    baselines = list_available_baselines()
-    return BaselinesResponse(baselines=baselines)
+    return BaselinesResponse(baselines=list_available_baselines())
 
@@ -15,16 +15,22 @@ CRITICAL CONSTRAINTS (M10.5):
 
 from __future__ import annotations
 
+import functools
 import hashlib
-import json
+import hmac
 import logging
+import mmap
 import os
 import re
 from pathlib import Path
 from typing import Any
 
-from fastapi import APIRouter, HTTPException
-from pydantic import BaseModel
+from fastapi import APIRouter, HTTPException, Request
+from fastapi.responses import Response
+from pydantic import BaseModel, ConfigDict
+
+from app import json_codec
+from app.json_codec import SortedJSONResponse
 
 logger = logging.getLogger(__name__)
 
@@ -43,7 +49,12 @@ def _get_app_env() -> str:
 
 
 class CaseInfo(BaseModel):
-    """Summary information about a demo case."""
+    """Summary information about a demo case.
+
+    Frozen because instances are shared through the case-list cache.
+    """
+
+    model_config = ConfigDict(frozen=True)
 
     case_id: str
     title: str
@@ -116,32 +127,27 @@ def _validate_case_id(case_id: str) -> None:
     Raises:
         HTTPException: If case ID is invalid.
     """
-    if not VALID_CASE_ID_PATTERN.match(case_id):
+    # fullmatch: "$" alone would accept a trailing newline. The character
+    # class already excludes ".", "/" and "\\", so no traversal is possible.
+    if not VALID_CASE_ID_PATTERN.fullmatch(case_id):
         raise HTTPException(
             status_code=400,
             detail=f"Invalid case ID format: {case_id}",
         )
 
-    # Additional path traversal protection
-    if ".." in case_id or "/" in case_id or "\\" in case_id:
-        raise HTTPException(
-            status_code=400,
-            detail="Path traversal detected",
-        )
-
 
-def _load_json_artifact(case_id: str, filename: str) -> dict[str, Any]:
-    """Load a JSON artifact for a case.
+def _resolve_artifact_path(case_id: str, filename: str) -> Path:
+    """Resolve and validate the on-disk path of a case artifact.
 
     Args:
         case_id: The case identifier.
         filename: The artifact filename.
 
     Returns:
-        Parsed JSON data.
+        Resolved path inside the artifact root.
 
     Raises:
-        HTTPException: If artifact not found or invalid.
+        HTTPException: If the case ID is invalid or the artifact not found.
     """
     _validate_case_id(case_id)
 
@@ -168,51 +174,183 @@ def _load_json_artifact(case_id: str, filename: str) -> dict[str, Any]:
             detail=f"Artifact not found: {case_id}/{filename}",
         )
 
+    return artifact_path
+
+
+def _parse_json_artifact(artifact_path: Path) -> dict[str, Any]:
+    """Parse a resolved JSON artifact.
+
+    Raises:
+        HTTPException: If the artifact is not valid JSON.
+    """
     try:
-        with open(artifact_path, encoding="utf-8") as f:
-            return json.load(f)
-    except json.JSONDecodeError as e:
+        data: dict[str, Any] = json_codec.loads(artifact_path.read_bytes())
+    except json_codec.JSONDecodeError as e:
         logger.error(f"Invalid JSON in artifact {artifact_path}: {e}")
         raise HTTPException(
             status_code=500,
-            detail=f"Invalid artifact format: {filename}",
+            detail=f"Invalid artifact format: {artifact_path.name}",
         )
+    return data
 
 
-def _list_cases() -> list[CaseInfo]:
-    """List all available demo cases.
+def _load_json_artifact(case_id: str, filename: str) -> dict[str, Any]:
+    """Load a JSON artifact for a case.
+
+    Args:
+        case_id: The case identifier.
+        filename: The artifact filename.
 
     Returns:
-        List of CaseInfo objects.
+        Parsed JSON data.
+
+    Raises:
+        HTTPException: If artifact not found or invalid.
     """
-    artifact_path = _get_artifact_path()
-    cases: list[CaseInfo] = []
+    return _parse_json_artifact(_resolve_artifact_path(case_id, filename))
 
-    for case_dir in sorted(artifact_path.iterdir()):
-        if not case_dir.is_dir():
-            continue
 
-        manifest_path = case_dir / "manifest.json"
-        if not manifest_path.exists():
-            continue
+@functools.lru_cache(maxsize=256)
+def _render_artifact(
+    artifact_path: Path,
+    mtime_ns: int,
+    size: int,
+    case_id: str,
+    artifact_type: str,
+    synthetic_key: str,
+) -> tuple[bytes, str]:
+    """Render an ArtifactResponse body and its ETag.
+
+    Keyed on the file's mtime and size so an edited artifact is re-read;
+    unchanged artifacts are served without re-parsing or re-serializing.
 
+    Returns:
+        Tuple of (JSON body bytes, quoted SHA-256 ETag).
+    """
+    data = _parse_json_artifact(artifact_path)
+    body = json_codec.dumps(
+        {
+            "artifact_type": artifact_type,
+            "case_id": case_id,
+            "data": data,
+            "synthetic": data.get(synthetic_key, True),
+        }
+    )
+    return body, f'"{hashlib.sha256(body).hexdigest()}"'
+
+
+def _artifact_response(
+    request: Request,
+    case_id: str,
+    filename: str,
+    artifact_type: str,
+    synthetic_key: str = "_synthetic",
+) -> Response:
+    """Serve a cached artifact body, or 304 when If-None-Match matches its ETag."""
+    artifact_path = _resolve_artifact_path(case_id, filename)
+    stat = artifact_path.stat()
+    body, etag = _render_artifact(
+        artifact_path, stat.st_mtime_ns, stat.st_size, case_id, artifact_type, synthetic_key
+    )
+
+    if_none_match = request.headers.get("if-none-match", "")
+    if etag in (tag.strip() for tag in if_none_match.split(",")):
+        return Response(status_code=304, headers={"ETag": etag})
+
+    return Response(
+        content=body,
+        media_type="application/json",
+        headers={"ETag": etag, "Cache-Control": "public, max-age=60"},
+    )
+
+
+@functools.lru_cache(maxsize=4)
+def _load_case_infos(
+    artifact_root: str,
+    manifests: tuple[tuple[str, int, int], ...],
+) -> tuple[CaseInfo, ...]:
+    """Parse case manifests into CaseInfo objects.
+
+    Args:
+        artifact_root: Artifact root directory.
+        manifests: Sorted (case dir name, manifest mtime_ns, manifest size)
+            entries. The stat fields only serve as the cache key, so an
+            edited manifest is re-parsed.
+
+    Returns:
+        Tuple of CaseInfo objects in case directory order.
+    """
+    cases: list[CaseInfo] = []
+
+    for case_name, _, _ in manifests:
+        manifest_path = Path(artifact_root) / case_name / "manifest.json"
         try:
-            with open(manifest_path, encoding="utf-8") as f:
-                manifest = json.load(f)
+            manifest = json_codec.loads(manifest_path.read_bytes())
 
             cases.append(
                 CaseInfo(
-                    case_id=manifest.get("case_id", case_dir.name),
+                    case_id=manifest.get("case_id", case_name),
                     title=manifest.get("title", "Untitled"),
                     description=manifest.get("description", ""),
                     synthetic=manifest.get("synthetic", True),
                 )
             )
-        except (json.JSONDecodeError, KeyError) as e:
-            logger.warning(f"Skipping invalid case {case_dir.name}: {e}")
+        except (json_codec.JSONDecodeError, KeyError) as e:
+            logger.warning(f"Skipping invalid case {case_name}: {e}")
             continue
 
-    return cases
+    return tuple(cases)
+
+
+def _scan_manifests() -> tuple[str, tuple[tuple[str, int, int], ...]]:
+    """Stat every case manifest under the artifact root.
+
+    Returns:
+        Tuple of (artifact root, sorted (case dir name, manifest mtime_ns,
+        manifest size) entries), the cache key for case-list parsing.
+    """
+    artifact_path = _get_artifact_path()
+    manifests: list[tuple[str, int, int]] = []
+
+    with os.scandir(artifact_path) as entries:
+        for entry in entries:
+            if not entry.is_dir():
+                continue
+            try:
+                stat = os.stat(os.path.join(entry.path, "manifest.json"))
+            except FileNotFoundError:
+                continue
+            manifests.append((entry.name, stat.st_mtime_ns, stat.st_size))
+
+    manifests.sort()
+    return str(artifact_path), tuple(manifests)
+
+
+def _list_cases() -> list[CaseInfo]:
+    """List all available demo cases.
+
+    Manifests are only stat()ed per call; parsing is cached until a
+    manifest is added, removed or modified.
+
+    Returns:
+        List of CaseInfo objects.
+    """
+    return list(_load_case_infos(*_scan_manifests()))
+
+
+@functools.lru_cache(maxsize=4)
+def _render_case_list(
+    artifact_root: str,
+    manifests: tuple[tuple[str, int, int], ...],
+) -> bytes:
+    """Render the CaseListResponse body for a manifest snapshot.
+
+    Each case is serialized once and the body is spliced together, so a
+    warm request copies bytes instead of re-encoding every case.
+    """
+    cases = _load_case_infos(artifact_root, manifests)
+    case_bodies = [json_codec.dumps(case.model_dump()) for case in cases]
+    return b'{"cases":[%b],"total":%d}' % (b",".join(case_bodies), len(cases))
 
 
 @router.get("/health", response_model=DemoHealthResponse)
@@ -239,105 +377,126 @@ def demo_health() -> DemoHealthResponse:
 
 
 @router.get("/cases", response_model=CaseListResponse)
-def list_cases() -> CaseListResponse:
+def list_cases() -> Response:
     """List available demo cases.
 
-    Returns all cases with manifest information.
+    Returns all cases with manifest information, in the CaseListResponse
+    shape.
     """
-    cases = _list_cases()
-    return CaseListResponse(
-        cases=cases,
-        total=len(cases),
+    return Response(
+        content=_render_case_list(*_scan_manifests()),
+        media_type="application/json",
     )
 
 
 @router.get("/cases/{case_id}/manifest", response_model=ArtifactResponse)
-def get_manifest(case_id: str) -> ArtifactResponse:
+def get_manifest(case_id: str, request: Request) -> Response:
     """Get case manifest.
 
     Args:
         case_id: The case identifier.
+        request: The incoming request (for If-None-Match).
 
     Returns:
-        Manifest data wrapped in ArtifactResponse.
+        Manifest data in the ArtifactResponse shape, with an ETag.
     """
-    data = _load_json_artifact(case_id, "manifest.json")
-    return ArtifactResponse(
-        case_id=case_id,
-        artifact_type="manifest",
-        data=data,
-        synthetic=data.get("synthetic", True),
-    )
+    return _artifact_response(request, case_id, "manifest.json", "manifest", synthetic_key="synthetic")
 
 
 @router.get("/cases/{case_id}/surface", response_model=ArtifactResponse)
-def get_surface(case_id: str) -> ArtifactResponse:
+def get_surface(case_id: str, request: Request) -> Response:
     """Get robustness surface data.
 
     Args:
         case_id: The case identifier.
+        request: The incoming request (for If-None-Match).
 
     Returns:
-        Surface data wrapped in ArtifactResponse.
+        Surface data in the ArtifactResponse shape, with an ETag.
     """
-    data = _load_json_artifact(case_id, "robustness_surface.json")
-    return ArtifactResponse(
-        case_id=case_id,
-        artifact_type="robustness_surface",
-        data=data,
-        synthetic=data.get("_synthetic", True),
-    )
+    return _artifact_response(request, case_id, "robustness_surface.json", "robustness_surface")
 
 
 @router.get("/cases/{case_id}/overlay", response_model=ArtifactResponse)
-def get_overlay(case_id: str) -> ArtifactResponse:
+def get_overlay(case_id: str, request: Request) -> Response:
     """Get overlay bundle data.
 
     Args:
         case_id: The case identifier.
+        request: The incoming request (for If-None-Match).
 
     Returns:
-        Overlay bundle data wrapped in ArtifactResponse.
+        Overlay bundle data in the ArtifactResponse shape, with an ETag.
     """
-    data = _load_json_artifact(case_id, "overlay_bundle.json")
-    return ArtifactResponse(
-        case_id=case_id,
-        artifact_type="overlay_bundle",
-        data=data,
-        synthetic=data.get("_synthetic", True),
-    )
+    return _artifact_response(request, case_id, "overlay_bundle.json", "overlay_bundle")
 
 
 @router.get("/cases/{case_id}/metrics", response_model=ArtifactResponse)
-def get_metrics(case_id: str) -> ArtifactResponse:
+def get_metrics(case_id: str, request: Request) -> Response:
     """Get probe metrics data.
 
     Args:
         case_id: The case identifier.
+        request: The incoming request (for If-None-Match).
 
     Returns:
-        Metrics data wrapped in ArtifactResponse.
+        Metrics data in the ArtifactResponse shape, with an ETag.
     """
-    data = _load_json_artifact(case_id, "metrics.json")
-    return ArtifactResponse(
-        case_id=case_id,
-        artifact_type="metrics",
-        data=data,
-        synthetic=data.get("_synthetic", True),
-    )
+    return _artifact_response(request, case_id, "metrics.json", "metrics")
 
 
 @router.get("/cases/{case_id}/checksums")
-def get_checksums(case_id: str) -> dict[str, Any]:
+def get_checksums(case_id: str) -> SortedJSONResponse:
     """Get artifact checksums.
 
     Args:
         case_id: The case identifier.
 
     Returns:
-        Checksums data.
+        Checksums data, serialized directly from the parsed artifact.
     """
-    return _load_json_artifact(case_id, "checksums.json")
+    return SortedJSONResponse(_load_json_artifact(case_id, "checksums.json"))
+
+
+def _sha256_artifact(file_path: Path) -> str:
+    """Return the uppercase SHA-256 of a file with CRLF normalized to LF.
+
+    The file is memory-mapped so LF-only files (the common case) are hashed
+    straight from the page cache without a Python-level copy.
+    """
+    with open(file_path, "rb") as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return hashlib.sha256(b"").hexdigest().upper()
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            # Normalize CRLF to LF for consistent hashing across platforms
+            if mm.find(b"\r\n") == -1:
+                with memoryview(mm) as view:
+                    return hashlib.sha256(view).hexdigest().upper()
+            return hashlib.sha256(mm[:].replace(b"\r\n", b"\n")).hexdigest().upper()
+
+
+@functools.lru_cache(maxsize=64)
+def _expected_checksums(
+    checksums_path: Path, mtime_ns: int, size: int
+) -> tuple[tuple[str, bytes], ...]:
+    """Parse checksums.json into (filename, uppercase digest) pairs.
+
+    Keyed on the file's mtime and size so an edited checksums file is
+    re-read.
+    """
+    checksums = _parse_json_artifact(checksums_path)
+    return tuple(
+        (filename, expected_hash.upper().encode("utf-8"))
+        for filename, expected_hash in checksums.get("files", {}).items()
+    )
+
+
+def _sha256_artifact_or_none(file_path: Path) -> str | None:
+    """Return _sha256_artifact(file_path), or None if the file is missing."""
+    try:
+        return _sha256_artifact(file_path)
+    except FileNotFoundError:
+        return None
 
 
 def verify_artifact_integrity(case_id: str) -> dict[str, bool]:
@@ -349,30 +508,22 @@ def verify_artifact_integrity(case_id: str) -> dict[str, bool]:
     Returns:
         Dictionary mapping filename to integrity status.
     """
-    _validate_case_id(case_id)
-    checksums = _load_json_artifact(case_id, "checksums.json")
+    checksums_path = _resolve_artifact_path(case_id, "checksums.json")
+    stat = checksums_path.stat()
+    expected = _expected_checksums(checksums_path, stat.st_mtime_ns, stat.st_size)
 
+    case_dir = checksums_path.parent
     results: dict[str, bool] = {}
-    artifact_path = _get_artifact_path() / case_id
-
-    for filename, expected_hash in checksums.get("files", {}).items():
-        file_path = artifact_path / filename
-        if not file_path.exists():
-            results[filename] = False
-            continue
-
-        # Compute actual hash (normalize line endings for cross-platform)
-        content = file_path.read_bytes()
-        # Normalize CRLF to LF for consistent hashing across platforms
-        content_normalized = content.replace(b"\r\n", b"\n")
-        actual_hash = hashlib.sha256(content_normalized).hexdigest().upper()
-        results[filename] = actual_hash == expected_hash.upper()
-
+    for filename, expected_hash in expected:
+        actual = _sha256_artifact_or_none(case_dir / filename)
+        results[filename] = actual is not None and hmac.compare_digest(
+            actual.encode("utf-8"), expected_hash
+        )
     return results
 
 
 @router.get("/cases/{case_id}/verify")
-def verify_case(case_id: str) -> dict[str, Any]:
+def verify_case(case_id: str) -> SortedJSONResponse:
     """Verify case artifact integrity.
 
     Args:
@@ -384,9 +535,11 @@ def verify_case(case_id: str) -> dict[str, Any]:
     results = verify_artifact_integrity(case_id)
     all_valid = all(results.values()) if results else False
 
-    return {
-        "case_id": case_id,
-        "valid": all_valid,
-        "files": results,
-    }
+    return SortedJSONResponse(
+        {
+            "case_id": case_id,
+            "valid": all_valid,
+            "files": results,
+        }
+    )
 
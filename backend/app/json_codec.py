@@ -0,0 +1,42 @@
+"""JSON encode/decode helpers shared by the routers.
+
+Everything goes through stdlib json so response bytes (and the ETags
+derived from them) are identical in every environment: compact separators,
+sorted keys, UTF-8, and stdlib's float and NaN spelling.
+"""
+
+from __future__ import annotations
+
+import json
+from typing import Any
+
+from fastapi.responses import Response
+
+JSONDecodeError = json.JSONDecodeError
+
+
+def loads(data: bytes | bytearray | memoryview | str) -> Any:
+    """Parse JSON from bytes, a buffer view or str."""
+    if isinstance(data, memoryview):
+        data = data.tobytes()
+    return json.loads(data)
+
+
+def dumps(obj: Any) -> bytes:
+    """Serialize to compact, key-sorted UTF-8 JSON bytes."""
+    return json.dumps(
+        obj, sort_keys=True, separators=(",", ":"), ensure_ascii=False
+    ).encode("utf-8")
+
+
+class SortedJSONResponse(Response):
+    """JSON response rendered with dumps().
+
+    Returning this from a handler skips FastAPI's jsonable_encoder and
+    response-model serialization; content must already be JSON-native.
+    """
+
+    media_type = "application/json"
+
+    def render(self, content: Any) -> bytes:
+        return dumps(content)
@@ -0,0 +1,45 @@
+"""Shared pytest fixtures for the CLARITY backend test suite."""
+
+from __future__ import annotations
+
+from collections.abc import Iterator
+
+import pytest
+from fastapi.testclient import TestClient
+from PIL import Image
+
+from app.main import app
+
+
+@pytest.fixture(scope="session")
+def client() -> Iterator[TestClient]:
+    """Return a test client shared across the session.
+
+    The app is read-only across tests, so one client is enough. Dependency
+    overrides are cleared at teardown so no test can leak state into another.
+    """
+    test_client = TestClient(app)
+    yield test_client
+    test_client.app.dependency_overrides.clear()
+
+
+# Read-only source images. Consumers such as apply_mask copy before writing,
+# so one buffer per shape can be shared by every test in the session.
+
+
+@pytest.fixture(scope="session")
+def tiny_image() -> Image.Image:
+    """Return a shared 1x1 white RGB image."""
+    return Image.new("RGB", (1, 1), (255, 255, 255))
+
+
+@pytest.fixture(scope="session")
+def small_image_10() -> Image.Image:
+    """Return a shared 10x10 white RGB image."""
+    return Image.new("RGB", (10, 10), (255, 255, 255))
+
+
+@pytest.fixture(scope="session")
+def wide_image() -> Image.Image:
+    """Return a shared 200x50 white RGB image."""
+    return Image.new("RGB", (200, 50), (255, 255, 255))
@@ -6,6 +6,7 @@ M12: Tests for cache key generation and cache manager.
 from __future__ import annotations
 
 import hashlib
+import itertools
 import json
 import os
 import tempfile
@@ -28,6 +29,7 @@ from app.clarity.cache.cache_manager import (
     CacheInProgressError,
     CacheLockError,
     FileLock,
+    _filename_stem,
     get_cache_dir,
 )
 
@@ -278,6 +280,41 @@ class TestGetCacheDir:
             assert result == tmp_path
 
 
+class TestFilenameStem:
+    """Tests for _filename_stem function."""
+
+    def test_safe_key_kept_verbatim(self):
+        """Test short alphanumeric keys are used as-is."""
+        assert _filename_stem("key1") == "key1"
+
+    def test_case_hash_kept_verbatim(self):
+        """Test SHA256 hex keys from compute_case_hash are used as-is."""
+        key = hashlib.sha256(b"case").hexdigest()
+        assert _filename_stem(key) == key
+
+    def test_unsafe_key_hashed(self):
+        """Test keys with path characters are hashed."""
+        stem = _filename_stem("../etc/passwd")
+        assert stem.startswith("h_") and len(stem) == 34
+        assert "/" not in stem and "." not in stem
+
+    def test_long_key_hashed(self):
+        """Test keys longer than the safe limit are hashed."""
+        assert len(_filename_stem("a" * 200)) == 34
+
+    def test_hashed_stem_deterministic(self):
+        """Test hashed stems are stable across calls."""
+        assert _filename_stem("a b") == _filename_stem("a b")
+
+    def test_literal_key_cannot_collide_with_hashed_stem(self):
+        """Test literal keys never reuse a hashed stem's filename."""
+        hashed = _filename_stem("a b")
+        digest = hashed.removeprefix("h_")
+        assert _filename_stem(digest) == digest
+        assert _filename_stem(hashed) != hashed
+        assert _filename_stem(hashed).startswith("h_")
+
+
 class TestFileLock:
     """Tests for FileLock class."""
 
@@ -375,6 +412,32 @@ class TestCacheManager:
         result = cache.get("largekey")
         assert result == large_data
 
+    def test_get_view_returns_readonly_view(self, cache: CacheManager):
+        """Test get_view returns a read-only view of cached bytes."""
+        cache.put("viewkey", b"view data", extension=".pdf")
+        view = cache.get_view("viewkey", extension=".pdf")
+        assert isinstance(view, memoryview)
+        assert view.readonly
+        assert bytes(view) == b"view data"
+
+    def test_get_view_missing_returns_none(self, cache: CacheManager):
+        """Test get_view returns None for missing key."""
+        assert cache.get_view("nonexistent") is None
+
+    def test_get_view_empty_entry(self, cache: CacheManager):
+        """Test get_view handles zero-length entries."""
+        cache.put("emptykey", b"")
+        view = cache.get_view("emptykey")
+        assert view is not None
+        assert bytes(view) == b""
+        assert cache.get("emptykey") == b""
+
+    def test_unsafe_key_stays_in_cache_dir(self, cache: CacheManager):
+        """Test unsafe keys are stored inside the cache directory."""
+        path = cache.put("../escape", b"data")
+        assert path.parent == cache.cache_dir
+        assert cache.get("../escape") == b"data"
+
     def test_clear(self, cache: CacheManager):
         """Test clear removes all cache entries."""
         cache.put("key1", b"data1")
@@ -426,19 +489,18 @@ class TestCacheManagerGetOrCreate:
 
     def test_caches_generated_data(self, cache: CacheManager):
         """Test generated data is cached for future requests."""
-        call_count = [0]
+        call_count = itertools.count()
 
         def generator() -> bytes:
-            call_count[0] += 1
+            next(call_count)
             return b"data"
 
-        # First call generates
+        # First call generates, second call uses cache
         cache.get_or_create("key1", generator)
-        assert call_count[0] == 1
-
-        # Second call uses cache
         cache.get_or_create("key1", generator)
-        assert call_count[0] == 1
+
+        # Exactly one generation leaves the counter at 1
+        assert next(call_count) == 1
 
     def test_extension_supported(self, cache: CacheManager):
         """Test get_or_create with file extension."""
@@ -464,14 +526,12 @@ class TestCacheManagerConcurrency:
 
     def test_concurrent_get_or_create_single_generation(self, cache: CacheManager):
         """Test only one generation occurs for concurrent requests."""
-        generation_count = [0]
-        generation_lock = threading.Lock()
+        generation_count = itertools.count()
         results: list[bytes] = []
         errors: list[Exception] = []
 
         def slow_generator() -> bytes:
-            with generation_lock:
-                generation_count[0] += 1
+            next(generation_count)  # atomic in CPython, no lock needed
             time.sleep(0.5)  # Slow generation
             return b"generated data"
 
@@ -497,7 +557,7 @@ class TestCacheManagerConcurrency:
 
         # Only one generation should have occurred
         # (others waited or got cache hit)
-        assert generation_count[0] == 1
+        assert next(generation_count) == 1
 
     def test_parallel_different_keys(self, cache: CacheManager):
         """Test parallel requests with different keys both succeed."""
@@ -9,16 +9,9 @@ Test Categories:
 
 from __future__ import annotations
 
-import pytest
 from fastapi.testclient import TestClient
 
-from app.main import app
-
-
-@pytest.fixture
-def client() -> TestClient:
-    """Return test client."""
-    return TestClient(app)
+# The session-scoped ``client`` fixture lives in conftest.py.
 
 
 # =============================================================================
@@ -12,19 +12,23 @@ Test Categories:
 6. Determinism (4 tests)
 7. Error Handling (6 tests)
 8. Serialization (5 tests)
-9. Guardrails AST-based (6 tests)
+9. Guardrails AST-based (3 tests)
 """
 
 from __future__ import annotations
 
 import ast
 import json
+import re
+from collections.abc import Callable, Iterator, Mapping
 from pathlib import Path
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 
+import numpy as np
 import pytest
 from PIL import Image
 
+from app import json_codec
 from app.clarity import (
     CounterfactualComputationError,
     ProbeSurface,
@@ -37,6 +41,7 @@ from app.clarity.counterfactual_orchestrator import (
     OrchestratorResult,
     RunnerResult,
     StubbedRunner,
+    clear_baseline_cache,
     list_available_baselines,
     load_baseline_registry,
     load_baseline_spec,
@@ -46,45 +51,157 @@ from app.clarity.counterfactual_orchestrator import (
 # Fixtures directory for tests
 FIXTURES_DIR = Path(__file__).parent / "fixtures" / "baselines"
 
+# Modules the orchestrator must never import
+_FORBIDDEN_MODULES = frozenset({"subprocess", "random", "uuid", "numpy", "np"})
+
+# Raw pixels for the shared 64x64 gray test image
+_GRAY_TILE = bytes((100, 100, 100)) * (64 * 64)
+
+# Text-level pre-check for the same guardrails. Anchored to import statements
+# and call syntax so the module docstring ("no datetime.now, no uuid") passes.
+_FORBIDDEN_SOURCE_RE = re.compile(
+    r"^\s*(?:import|from)\s+(?:subprocess|random|uuid|numpy|r2l)\b"
+    r"|\bdatetime\.(?:now|utcnow)\s*\(",
+    re.MULTILINE,
+)
+
 
 # =============================================================================
 # Fixtures
 # =============================================================================
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def fixtures_dir() -> Path:
     """Return the fixtures directory path."""
     return FIXTURES_DIR
 
 
+@pytest.fixture(scope="session")
+def cached_registry(fixtures_dir: Path) -> Mapping[str, dict[str, Any]]:
+    """Return the fixture registry, parsed once per session."""
+    return load_baseline_registry(fixtures_dir)
+
+
+@pytest.fixture(scope="session")
+def cached_specs(fixtures_dir: Path) -> dict[str, BaselineSpec]:
+    """Return every fixture baseline spec, parsed once per session."""
+    return {
+        baseline_id: load_baseline_spec(baseline_id, fixtures_dir)
+        for baseline_id in list_available_baselines(fixtures_dir)
+    }
+
+
+@pytest.fixture(scope="session", autouse=True)
+def _warm_baseline_cache(cached_specs: dict[str, BaselineSpec]) -> None:
+    """Load every fixture spec and decode its image once, up front.
+
+    Specs land in the loaders' LRU cache and the PNGs in the OS page cache,
+    so per-test runs skip the cold reads.
+    """
+    for spec in cached_specs.values():
+        with Image.open(spec.image_path) as img:
+            img.load()
+
+
+@pytest.fixture
+def scratch_dir(tmp_path: Path) -> Iterator[Path]:
+    """Return a throwaway fixtures dir; memoized loads are dropped afterwards."""
+    yield tmp_path
+    clear_baseline_cache()
+
+
 @pytest.fixture
 def stubbed_runner() -> StubbedRunner:
     """Return a default stubbed runner."""
     return StubbedRunner()
 
 
+@pytest.fixture(scope="session")
+def sample_config() -> OrchestratorConfig:
+    """Return a frozen config shared by the configuration tests."""
+    return OrchestratorConfig(grid_size=3, axis="brightness", value="1p0")
+
+
+@pytest.fixture(scope="session")
+def orchestrator_factory(
+    fixtures_dir: Path,
+) -> Callable[..., CounterfactualOrchestrator]:
+    """Return a builder for orchestrators over the fixture baselines.
+
+    Passing no runner gives the orchestrator a fresh StubbedRunner.
+    """
+
+    def make(runner: StubbedRunner | None = None) -> CounterfactualOrchestrator:
+        return CounterfactualOrchestrator(runner or StubbedRunner(), fixtures_dir)
+
+    return make
+
+
 @pytest.fixture
-def orchestrator(stubbed_runner: StubbedRunner, fixtures_dir: Path) -> CounterfactualOrchestrator:
+def orchestrator(
+    stubbed_runner: StubbedRunner,
+    orchestrator_factory: Callable[..., CounterfactualOrchestrator],
+) -> CounterfactualOrchestrator:
     """Return an orchestrator with stubbed runner."""
-    return CounterfactualOrchestrator(stubbed_runner, fixtures_dir)
+    return orchestrator_factory(stubbed_runner)
 
 
-@pytest.fixture
-def test_image() -> Image.Image:
-    """Create a simple test image."""
-    return Image.new("RGB", (64, 64), (100, 100, 100))
+@pytest.fixture(scope="session")
+def shared_orchestrator_result(
+    orchestrator_factory: Callable[..., CounterfactualOrchestrator],
+) -> OrchestratorResult:
+    """Return one k=2 brightness run, shared by tests that only read it."""
+    return orchestrator_factory().run(
+        baseline_id="test-baseline-001",
+        grid_size=2,
+        axis="brightness",
+        value="1p0",
+    )
 
 
-@pytest.fixture
-def masked_test_image() -> Image.Image:
-    """Create a test image with masked region."""
+@pytest.fixture(scope="module")
+def reference_dict(shared_orchestrator_result: OrchestratorResult) -> dict[str, Any]:
+    """Serialized k=2 reference run that determinism tests compare against."""
+    return shared_orchestrator_result.to_dict()
+
+
+@pytest.fixture(scope="module")
+def serialized_result(
+    shared_orchestrator_result: OrchestratorResult,
+) -> tuple[OrchestratorResult, dict[str, Any], str]:
+    """Return the shared run with its to_dict() and sorted-key JSON, built once."""
+    d = shared_orchestrator_result.to_dict()
+    return shared_orchestrator_result, d, json.dumps(d, sort_keys=True)
+
+
+def _shared_readonly(img: Image.Image) -> Iterator[Image.Image]:
+    """Yield a session-shared image and fail teardown if a test mutated it."""
+    snapshot = img.tobytes()
+    yield img
+    assert img.tobytes() == snapshot, "shared test image was mutated"
+
+
+@pytest.fixture(scope="session")
+def test_image() -> Iterator[Image.Image]:
+    """Create a simple test image (read-only, shared)."""
+    # RGB is unpacked to Pillow's 4-byte layout, so this copies rather than maps
+    yield from _shared_readonly(Image.frombuffer("RGB", (64, 64), _GRAY_TILE, "raw", "RGB", 0, 1))
+
+
+@pytest.fixture(scope="session")
+def masked_test_image() -> Iterator[Image.Image]:
+    """Create a test image with masked region (read-only, shared)."""
     img = Image.new("RGB", (64, 64), (100, 100, 100))
     # Add gray fill in center
-    for x in range(30, 35):
-        for y in range(30, 35):
-            img.putpixel((x, y), (128, 128, 128))
-    return img
+    img.paste((128, 128, 128), (30, 30, 35, 35))
+    yield from _shared_readonly(img)
+
+
+@pytest.fixture(scope="module")
+def baseline_runner_result(test_image: Image.Image) -> RunnerResult:
+    """Return one stubbed run on the unmasked test image."""
+    return StubbedRunner().run(test_image, "prompt", "axis", "value", 42)
 
 
 # =============================================================================
@@ -95,51 +212,77 @@ def masked_test_image() -> Image.Image:
 class TestBaselineRegistryLoading:
     """Tests for baseline registry loading."""
 
-    def test_load_registry_success(self, fixtures_dir: Path) -> None:
+    def test_load_registry_success(self, cached_registry: Mapping[str, dict[str, Any]]) -> None:
         """Test successful registry loading."""
-        registry = load_baseline_registry(fixtures_dir)
-        assert isinstance(registry, dict)
-        assert len(registry) >= 1
+        assert isinstance(cached_registry, Mapping)
+        assert len(cached_registry) >= 1
 
-    def test_load_registry_contains_expected_baselines(self, fixtures_dir: Path) -> None:
+    def test_load_registry_contains_expected_baselines(
+        self, cached_registry: Mapping[str, dict[str, Any]]
+    ) -> None:
         """Test registry contains expected baseline IDs."""
-        registry = load_baseline_registry(fixtures_dir)
-        assert "test-baseline-001" in registry
-        assert "test-baseline-002" in registry
+        assert "test-baseline-001" in cached_registry
+        assert "test-baseline-002" in cached_registry
 
-    def test_load_registry_entry_has_required_fields(self, fixtures_dir: Path) -> None:
+    def test_load_registry_entry_has_required_fields(
+        self, cached_registry: Mapping[str, dict[str, Any]]
+    ) -> None:
         """Test registry entries have required fields."""
-        registry = load_baseline_registry(fixtures_dir)
-        entry = registry["test-baseline-001"]
+        entry = cached_registry["test-baseline-001"]
         assert "name" in entry
         assert "image_file" in entry
         assert "spec_file" in entry
 
-    def test_load_registry_missing_directory_raises(self, tmp_path: Path) -> None:
+    def test_load_registry_missing_directory_raises(self, scratch_dir: Path) -> None:
         """Test missing directory raises error."""
         with pytest.raises(OrchestratorError, match="registry not found"):
-            load_baseline_registry(tmp_path / "nonexistent")
+            load_baseline_registry(scratch_dir / "nonexistent")
 
-    def test_load_registry_missing_file_raises(self, tmp_path: Path) -> None:
+    def test_load_registry_missing_file_raises(self, scratch_dir: Path) -> None:
         """Test missing registry file raises error."""
-        tmp_path.mkdir(exist_ok=True)
+        scratch_dir.mkdir(exist_ok=True)
         with pytest.raises(OrchestratorError, match="registry not found"):
-            load_baseline_registry(tmp_path)
+            load_baseline_registry(scratch_dir)
 
-    def test_load_registry_invalid_json_raises(self, tmp_path: Path) -> None:
+    def test_load_registry_invalid_json_raises(self, scratch_dir: Path) -> None:
         """Test invalid JSON raises error."""
-        registry_path = tmp_path / "registry.json"
+        registry_path = scratch_dir / "registry.json"
         registry_path.write_text("not valid json{")
         with pytest.raises(OrchestratorError, match="Invalid JSON"):
-            load_baseline_registry(tmp_path)
+            load_baseline_registry(scratch_dir)
 
-    def test_load_registry_empty_baselines(self, tmp_path: Path) -> None:
+    def test_load_registry_empty_baselines(self, scratch_dir: Path) -> None:
         """Test empty baselines returns empty dict."""
-        registry_path = tmp_path / "registry.json"
+        registry_path = scratch_dir / "registry.json"
         registry_path.write_text('{"baselines": {}}')
-        registry = load_baseline_registry(tmp_path)
+        registry = load_baseline_registry(scratch_dir)
         assert registry == {}
 
+    def test_load_registry_memoized(self, fixtures_dir: Path) -> None:
+        """Test repeated loads reuse the parsed registry."""
+        assert load_baseline_registry(fixtures_dir) is load_baseline_registry(fixtures_dir)
+
+    def test_load_registry_read_only(self, fixtures_dir: Path) -> None:
+        """Test the shared memoized registry cannot be mutated by callers."""
+        registry = load_baseline_registry(fixtures_dir)
+        with pytest.raises(TypeError):
+            registry["injected"] = {}  # type: ignore[index]
+        with pytest.raises(TypeError):
+            registry["test-baseline-001"]["spec_file"] = "x"  # type: ignore[index]
+        assert load_baseline_registry(fixtures_dir)["test-baseline-001"]["spec_file"] == (
+            "test_spec_001.json"
+        )
+
+    def test_clear_baseline_cache_reloads(self, scratch_dir: Path) -> None:
+        """Test clearing the cache picks up registry changes on disk."""
+        registry_path = scratch_dir / "registry.json"
+        registry_path.write_text('{"baselines": {}}')
+        assert load_baseline_registry(scratch_dir) == {}
+        registry_path.write_text('{"baselines": {"b": {}}}')
+        assert load_baseline_registry(scratch_dir) == {}
+        clear_baseline_cache()
+        assert load_baseline_registry(scratch_dir) == {"b": {}}
+
     def test_list_available_baselines(self, fixtures_dir: Path) -> None:
         """Test listing available baselines."""
         baselines = list_available_baselines(fixtures_dir)
@@ -147,6 +290,11 @@ class TestBaselineRegistryLoading:
         assert "test-baseline-001" in baselines
         assert baselines == sorted(baselines)  # Should be sorted
 
+    def test_list_available_baselines_returns_fresh_list(self, fixtures_dir: Path) -> None:
+        """Test callers cannot mutate the memoized baseline listing."""
+        list_available_baselines(fixtures_dir).clear()
+        assert "test-baseline-001" in list_available_baselines(fixtures_dir)
+
 
 # =============================================================================
 # Category 2: Baseline Spec Loading (9 tests)
@@ -156,37 +304,37 @@ class TestBaselineRegistryLoading:
 class TestBaselineSpecLoading:
     """Tests for baseline spec loading."""
 
-    def test_load_spec_success(self, fixtures_dir: Path) -> None:
+    def test_load_spec_success(self, cached_specs: dict[str, BaselineSpec]) -> None:
         """Test successful spec loading."""
-        spec = load_baseline_spec("test-baseline-001", fixtures_dir)
+        spec = cached_specs["test-baseline-001"]
         assert isinstance(spec, BaselineSpec)
 
-    def test_load_spec_has_correct_id(self, fixtures_dir: Path) -> None:
+    def test_load_spec_has_correct_id(self, cached_specs: dict[str, BaselineSpec]) -> None:
         """Test spec has correct baseline_id."""
-        spec = load_baseline_spec("test-baseline-001", fixtures_dir)
+        spec = cached_specs["test-baseline-001"]
         assert spec.baseline_id == "test-baseline-001"
 
-    def test_load_spec_has_image_path(self, fixtures_dir: Path) -> None:
+    def test_load_spec_has_image_path(self, cached_specs: dict[str, BaselineSpec]) -> None:
         """Test spec has valid image path."""
-        spec = load_baseline_spec("test-baseline-001", fixtures_dir)
+        spec = cached_specs["test-baseline-001"]
         assert spec.image_path.exists()
         assert spec.image_path.suffix == ".png"
 
-    def test_load_spec_has_prompt(self, fixtures_dir: Path) -> None:
+    def test_load_spec_has_prompt(self, cached_specs: dict[str, BaselineSpec]) -> None:
         """Test spec has prompt."""
-        spec = load_baseline_spec("test-baseline-001", fixtures_dir)
+        spec = cached_specs["test-baseline-001"]
         assert spec.prompt
         assert isinstance(spec.prompt, str)
 
-    def test_load_spec_has_axis(self, fixtures_dir: Path) -> None:
+    def test_load_spec_has_axis(self, cached_specs: dict[str, BaselineSpec]) -> None:
         """Test spec has axis."""
-        spec = load_baseline_spec("test-baseline-001", fixtures_dir)
+        spec = cached_specs["test-baseline-001"]
         assert spec.axis
         assert isinstance(spec.axis, str)
 
-    def test_load_spec_has_values(self, fixtures_dir: Path) -> None:
+    def test_load_spec_has_values(self, cached_specs: dict[str, BaselineSpec]) -> None:
         """Test spec has values tuple."""
-        spec = load_baseline_spec("test-baseline-001", fixtures_dir)
+        spec = cached_specs["test-baseline-001"]
         assert spec.values
         assert isinstance(spec.values, tuple)
 
@@ -195,9 +343,9 @@ class TestBaselineSpecLoading:
         with pytest.raises(OrchestratorError, match="Baseline not found"):
             load_baseline_spec("nonexistent-baseline", fixtures_dir)
 
-    def test_load_spec_to_dict(self, fixtures_dir: Path) -> None:
+    def test_load_spec_to_dict(self, cached_specs: dict[str, BaselineSpec]) -> None:
         """Test spec to_dict() produces valid output."""
-        spec = load_baseline_spec("test-baseline-001", fixtures_dir)
+        spec = cached_specs["test-baseline-001"]
         d = spec.to_dict()
         assert "baseline_id" in d
         assert "image_path" in d
@@ -205,10 +353,10 @@ class TestBaselineSpecLoading:
         assert "axis" in d
         assert d["values"] == list(spec.values)
 
-    def test_load_different_baselines(self, fixtures_dir: Path) -> None:
+    def test_load_different_baselines(self, cached_specs: dict[str, BaselineSpec]) -> None:
         """Test loading different baselines."""
-        spec1 = load_baseline_spec("test-baseline-001", fixtures_dir)
-        spec2 = load_baseline_spec("test-baseline-002", fixtures_dir)
+        spec1 = cached_specs["test-baseline-001"]
+        spec2 = cached_specs["test-baseline-002"]
         assert spec1.baseline_id != spec2.baseline_id
         assert spec1.axis != spec2.axis
 
@@ -226,23 +374,23 @@ class TestStubbedRunner:
         result = stubbed_runner.run(test_image, "prompt", "axis", "value", 42)
         assert isinstance(result, RunnerResult)
 
-    def test_runner_result_has_answer(self, stubbed_runner: StubbedRunner, test_image: Image.Image) -> None:
-        """Test result has answer."""
-        result = stubbed_runner.run(test_image, "prompt", "axis", "value", 42)
-        assert result.answer
-        assert isinstance(result.answer, str)
-
-    def test_runner_result_has_justification(self, stubbed_runner: StubbedRunner, test_image: Image.Image) -> None:
-        """Test result has justification."""
-        result = stubbed_runner.run(test_image, "prompt", "axis", "value", 42)
-        assert result.justification
-        assert isinstance(result.justification, str)
-
-    def test_runner_result_has_metrics(self, stubbed_runner: StubbedRunner, test_image: Image.Image) -> None:
-        """Test result has ESI and drift."""
-        result = stubbed_runner.run(test_image, "prompt", "axis", "value", 42)
-        assert 0.0 <= result.esi <= 1.0
-        assert 0.0 <= result.drift <= 1.0
+    @pytest.mark.parametrize(
+        "check",
+        [
+            pytest.param(lambda r: isinstance(r.answer, str) and r.answer, id="answer"),
+            pytest.param(
+                lambda r: isinstance(r.justification, str) and r.justification,
+                id="justification",
+            ),
+            pytest.param(lambda r: 0.0 <= r.esi <= 1.0, id="esi"),
+            pytest.param(lambda r: 0.0 <= r.drift <= 1.0, id="drift"),
+        ],
+    )
+    def test_runner_result_fields(
+        self, baseline_runner_result: RunnerResult, check: Callable[[RunnerResult], Any]
+    ) -> None:
+        """Test result has a populated answer, justification and in-range metrics."""
+        assert check(baseline_runner_result)
 
     def test_runner_detects_unmasked_image(self, stubbed_runner: StubbedRunner, test_image: Image.Image) -> None:
         """Test runner returns baseline values for unmasked image."""
@@ -264,10 +412,9 @@ class TestStubbedRunner:
         stubbed_runner.run(test_image, "prompt", "axis", "value", 42)
         assert stubbed_runner.call_count == 2
 
-    def test_runner_result_to_dict(self, stubbed_runner: StubbedRunner, test_image: Image.Image) -> None:
+    def test_runner_result_to_dict(self, baseline_runner_result: RunnerResult) -> None:
         """Test RunnerResult to_dict()."""
-        result = stubbed_runner.run(test_image, "prompt", "axis", "value", 42)
-        d = result.to_dict()
+        d = baseline_runner_result.to_dict()
         assert "answer" in d
         assert "justification" in d
         assert "esi" in d
@@ -310,28 +457,24 @@ class TestOrchestratorConfiguration:
         assert config.axis == "brightness"
         assert config.value == "1p0"
 
-    def test_config_is_frozen(self) -> None:
+    def test_config_is_frozen(self, sample_config: OrchestratorConfig) -> None:
         """Test config is immutable."""
-        config = OrchestratorConfig(grid_size=3, axis="brightness", value="1p0")
         with pytest.raises(Exception):  # FrozenInstanceError
-            config.grid_size = 5  # type: ignore
+            sample_config.grid_size = 5  # type: ignore
 
-    def test_config_to_dict(self) -> None:
+    def test_config_to_dict(self, sample_config: OrchestratorConfig) -> None:
         """Test config to_dict()."""
-        config = OrchestratorConfig(grid_size=3, axis="brightness", value="1p0")
-        d = config.to_dict()
+        d = sample_config.to_dict()
         assert d == {"axis": "brightness", "grid_size": 3, "value": "1p0"}
 
-    def test_config_equality(self) -> None:
+    def test_config_equality(self, sample_config: OrchestratorConfig) -> None:
         """Test config equality."""
-        config1 = OrchestratorConfig(grid_size=3, axis="brightness", value="1p0")
-        config2 = OrchestratorConfig(grid_size=3, axis="brightness", value="1p0")
-        assert config1 == config2
+        other = OrchestratorConfig(grid_size=3, axis="brightness", value="1p0")
+        assert sample_config == other
 
-    def test_config_hashable(self) -> None:
+    def test_config_hashable(self, sample_config: OrchestratorConfig) -> None:
         """Test config is hashable."""
-        config = OrchestratorConfig(grid_size=3, axis="brightness", value="1p0")
-        _ = hash(config)  # Should not raise
+        _ = hash(sample_config)  # Should not raise
 
 
 # =============================================================================
@@ -342,99 +485,55 @@ class TestOrchestratorConfiguration:
 class TestOrchestratorExecution:
     """Tests for orchestrator execution."""
 
-    def test_orchestrator_run_success(self, orchestrator: CounterfactualOrchestrator) -> None:
+    def test_orchestrator_run_success(self, shared_orchestrator_result: OrchestratorResult) -> None:
         """Test successful orchestration."""
-        result = orchestrator.run(
-            baseline_id="test-baseline-001",
-            grid_size=2,
-            axis="brightness",
-            value="1p0",
-        )
+        result = shared_orchestrator_result
         assert isinstance(result, OrchestratorResult)
 
-    def test_orchestrator_result_has_baseline_id(self, orchestrator: CounterfactualOrchestrator) -> None:
+    def test_orchestrator_result_has_baseline_id(self, shared_orchestrator_result: OrchestratorResult) -> None:
         """Test result has correct baseline_id."""
-        result = orchestrator.run(
-            baseline_id="test-baseline-001",
-            grid_size=2,
-            axis="brightness",
-            value="1p0",
-        )
+        result = shared_orchestrator_result
         assert result.baseline_id == "test-baseline-001"
 
-    def test_orchestrator_result_has_config(self, orchestrator: CounterfactualOrchestrator) -> None:
+    def test_orchestrator_result_has_config(self, shared_orchestrator_result: OrchestratorResult) -> None:
         """Test result has correct config."""
-        result = orchestrator.run(
-            baseline_id="test-baseline-001",
-            grid_size=2,
-            axis="brightness",
-            value="1p0",
-        )
+        result = shared_orchestrator_result
         assert result.config.grid_size == 2
         assert result.config.axis == "brightness"
         assert result.config.value == "1p0"
 
-    def test_orchestrator_result_has_baseline_metrics(self, orchestrator: CounterfactualOrchestrator) -> None:
+    def test_orchestrator_result_has_baseline_metrics(self, shared_orchestrator_result: OrchestratorResult) -> None:
         """Test result has baseline metrics."""
-        result = orchestrator.run(
-            baseline_id="test-baseline-001",
-            grid_size=2,
-            axis="brightness",
-            value="1p0",
-        )
+        result = shared_orchestrator_result
         assert isinstance(result.baseline_metrics, RunnerResult)
         assert result.baseline_metrics.esi == 1.0  # Baseline is unmasked
 
-    def test_orchestrator_result_has_probe_surface(self, orchestrator: CounterfactualOrchestrator) -> None:
+    def test_orchestrator_result_has_probe_surface(self, shared_orchestrator_result: OrchestratorResult) -> None:
         """Test result has probe surface."""
-        result = orchestrator.run(
-            baseline_id="test-baseline-001",
-            grid_size=2,
-            axis="brightness",
-            value="1p0",
-        )
+        result = shared_orchestrator_result
         assert isinstance(result.probe_surface, ProbeSurface)
 
-    def test_orchestrator_probe_surface_has_correct_count(self, orchestrator: CounterfactualOrchestrator) -> None:
-        """Test probe surface has k×k results."""
+    @pytest.mark.parametrize("k", [1, 2, 3, 4])
+    def test_orchestrator_probe_surface_count(
+        self, orchestrator: CounterfactualOrchestrator, k: int
+    ) -> None:
+        """Test probe surface has k×k results for each grid size."""
         result = orchestrator.run(
             baseline_id="test-baseline-001",
-            grid_size=3,
+            grid_size=k,
             axis="brightness",
             value="1p0",
         )
-        assert len(result.probe_surface.results) == 9  # 3×3
+        assert len(result.probe_surface.results) == k * k
 
-    def test_orchestrator_result_to_dict(self, orchestrator: CounterfactualOrchestrator) -> None:
+    def test_orchestrator_result_to_dict(self, shared_orchestrator_result: OrchestratorResult) -> None:
         """Test result to_dict() produces valid JSON."""
-        result = orchestrator.run(
-            baseline_id="test-baseline-001",
-            grid_size=2,
-            axis="brightness",
-            value="1p0",
-        )
+        result = shared_orchestrator_result
         d = result.to_dict()
         # Should be JSON serializable
         json_str = json.dumps(d, sort_keys=True)
         assert json_str
 
-    def test_orchestrator_different_grid_sizes(self, orchestrator: CounterfactualOrchestrator) -> None:
-        """Test different grid sizes."""
-        result2 = orchestrator.run(
-            baseline_id="test-baseline-001",
-            grid_size=2,
-            axis="brightness",
-            value="1p0",
-        )
-        result3 = orchestrator.run(
-            baseline_id="test-baseline-001",
-            grid_size=3,
-            axis="brightness",
-            value="1p0",
-        )
-        assert len(result2.probe_surface.results) == 4
-        assert len(result3.probe_surface.results) == 9
-
 
 # =============================================================================
 # Category 6: Determinism (4 tests)
@@ -444,32 +543,25 @@ class TestOrchestratorExecution:
 class TestDeterminism:
     """Tests for deterministic behavior."""
 
-    def test_orchestrator_deterministic_results(self, fixtures_dir: Path) -> None:
-        """Test orchestrator produces identical results on double-run."""
-        runner1 = StubbedRunner()
-        runner2 = StubbedRunner()
-        orch1 = CounterfactualOrchestrator(runner1, fixtures_dir)
-        orch2 = CounterfactualOrchestrator(runner2, fixtures_dir)
-
-        result1 = orch1.run("test-baseline-001", 2, "brightness", "1p0")
-        result2 = orch2.run("test-baseline-001", 2, "brightness", "1p0")
+    def test_orchestrator_deterministic_results(
+        self, orchestrator: CounterfactualOrchestrator, reference_dict: dict[str, Any]
+    ) -> None:
+        """Test a fresh run reproduces the reference run exactly."""
+        result = orchestrator.run("test-baseline-001", 2, "brightness", "1p0")
 
         # Compare serialized output
-        assert result1.to_dict() == result2.to_dict()
+        assert result.to_dict() == reference_dict
 
-    def test_probe_surface_deterministic_ordering(self, orchestrator: CounterfactualOrchestrator) -> None:
+    def test_probe_surface_deterministic_ordering(
+        self, orchestrator: CounterfactualOrchestrator, reference_dict: dict[str, Any]
+    ) -> None:
         """Test probe results are deterministically ordered."""
-        result1 = orchestrator.run("test-baseline-001", 2, "brightness", "1p0")
-
-        # Reset orchestrator
-        runner = StubbedRunner()
-        orch2 = CounterfactualOrchestrator(runner, FIXTURES_DIR)
-        result2 = orch2.run("test-baseline-001", 2, "brightness", "1p0")
+        result = orchestrator.run("test-baseline-001", 2, "brightness", "1p0")
 
         # Region IDs should be in same order
-        ids1 = [r.probe.region_id for r in result1.probe_surface.results]
-        ids2 = [r.probe.region_id for r in result2.probe_surface.results]
-        assert ids1 == ids2
+        ids = [r.probe.region_id for r in result.probe_surface.results]
+        reference_ids = [r["probe"]["region_id"] for r in reference_dict["probe_surface"]["results"]]
+        assert ids == reference_ids
 
     def test_region_id_format_stable(self, orchestrator: CounterfactualOrchestrator) -> None:
         """Test region ID format is stable."""
@@ -481,18 +573,14 @@ class TestDeterminism:
             assert "_c" in region_id
             assert "_k3" in region_id
 
-    def test_baseline_metrics_deterministic(self, fixtures_dir: Path) -> None:
+    def test_baseline_metrics_deterministic(
+        self, orchestrator: CounterfactualOrchestrator, reference_dict: dict[str, Any]
+    ) -> None:
         """Test baseline metrics are deterministic."""
-        runner1 = StubbedRunner()
-        runner2 = StubbedRunner()
-        orch1 = CounterfactualOrchestrator(runner1, fixtures_dir)
-        orch2 = CounterfactualOrchestrator(runner2, fixtures_dir)
-
-        result1 = orch1.run("test-baseline-001", 2, "brightness", "1p0")
-        result2 = orch2.run("test-baseline-001", 2, "brightness", "1p0")
+        result = orchestrator.run("test-baseline-001", 2, "brightness", "1p0")
 
-        assert result1.baseline_metrics.esi == result2.baseline_metrics.esi
-        assert result1.baseline_metrics.drift == result2.baseline_metrics.drift
+        assert result.baseline_metrics.esi == reference_dict["baseline_metrics"]["esi"]
+        assert result.baseline_metrics.drift == reference_dict["baseline_metrics"]["drift"]
 
 
 # =============================================================================
@@ -503,42 +591,59 @@ class TestDeterminism:
 class TestErrorHandling:
     """Tests for error handling."""
 
-    def test_invalid_baseline_id_raises(self, orchestrator: CounterfactualOrchestrator) -> None:
-        """Test invalid baseline ID raises error."""
-        with pytest.raises(OrchestratorError, match="Baseline not found"):
-            orchestrator.run("invalid-baseline", 3, "brightness", "1p0")
-
-    def test_invalid_grid_size_raises(self, orchestrator: CounterfactualOrchestrator) -> None:
-        """Test invalid grid_size raises error."""
-        with pytest.raises(OrchestratorError, match="grid_size must be >= 1"):
-            orchestrator.run("test-baseline-001", 0, "brightness", "1p0")
-
-    def test_negative_grid_size_raises(self, orchestrator: CounterfactualOrchestrator) -> None:
-        """Test negative grid_size raises error."""
-        with pytest.raises(OrchestratorError, match="grid_size must be >= 1"):
-            orchestrator.run("test-baseline-001", -1, "brightness", "1p0")
+    @pytest.mark.parametrize(
+        ("baseline_id", "grid_size", "message"),
+        [
+            pytest.param("invalid-baseline", 3, "Baseline not found", id="invalid_baseline"),
+            pytest.param("test-baseline-001", 0, "grid_size must be >= 1", id="zero_grid"),
+            pytest.param("test-baseline-001", -1, "grid_size must be >= 1", id="negative_grid"),
+        ],
+    )
+    def test_orchestrator_run_raises(
+        self,
+        orchestrator: CounterfactualOrchestrator,
+        baseline_id: str,
+        grid_size: int,
+        message: str,
+    ) -> None:
+        """Test invalid baseline ID or grid_size raises error."""
+        with pytest.raises(OrchestratorError, match=message):
+            orchestrator.run(baseline_id, grid_size, "brightness", "1p0")
 
-    def test_missing_image_raises(self, tmp_path: Path) -> None:
+    def test_missing_image_raises(self, scratch_dir: Path) -> None:
         """Test missing image file raises error."""
         # Create minimal registry pointing to nonexistent image
         registry = {"baselines": {"bad": {"image_file": "missing.png", "spec_file": "spec.json"}}}
-        (tmp_path / "registry.json").write_text(json.dumps(registry))
-        (tmp_path / "spec.json").write_text('{"axis": "x", "values": []}')
+        (scratch_dir / "registry.json").write_text(json.dumps(registry))
+        (scratch_dir / "spec.json").write_text('{"axis": "x", "values": []}')
 
         runner = StubbedRunner()
-        orch = CounterfactualOrchestrator(runner, tmp_path)
+        orch = CounterfactualOrchestrator(runner, scratch_dir)
         with pytest.raises(OrchestratorError, match="Image file not found"):
             orch.run("bad", 2, "x", "v")
 
-    def test_missing_spec_raises(self, tmp_path: Path) -> None:
+    def test_image_removed_after_cached_load_raises(self, scratch_dir: Path) -> None:
+        """Test a memoized spec still fails once its image file is gone."""
+        registry = {"baselines": {"b": {"image_file": "img.png", "spec_file": "spec.json"}}}
+        (scratch_dir / "registry.json").write_text(json.dumps(registry))
+        (scratch_dir / "spec.json").write_text('{"axis": "x", "values": []}')
+        image_path = scratch_dir / "img.png"
+        image_path.write_bytes(b"\x89PNG\r\n\x1a\n")
+
+        assert load_baseline_spec("b", scratch_dir).image_path == image_path
+        image_path.unlink()
+        with pytest.raises(OrchestratorError, match="Image file not found"):
+            load_baseline_spec("b", scratch_dir)
+
+    def test_missing_spec_raises(self, scratch_dir: Path) -> None:
         """Test missing spec file raises error."""
         registry = {"baselines": {"bad": {"image_file": "img.png", "spec_file": "missing.json"}}}
-        (tmp_path / "registry.json").write_text(json.dumps(registry))
-        # Create a dummy image
-        Image.new("RGB", (10, 10)).save(tmp_path / "img.png")
+        (scratch_dir / "registry.json").write_text(json.dumps(registry))
+        # Only existence is checked before the spec lookup fails; skip the PNG encoder
+        (scratch_dir / "img.png").write_bytes(b"\x89PNG\r\n\x1a\n")
 
         runner = StubbedRunner()
-        orch = CounterfactualOrchestrator(runner, tmp_path)
+        orch = CounterfactualOrchestrator(runner, scratch_dir)
         with pytest.raises(OrchestratorError, match="Spec file not found"):
             orch.run("bad", 2, "x", "v")
 
@@ -547,6 +652,14 @@ class TestErrorHandling:
         baselines = list_available_baselines(Path("/nonexistent"))
         assert baselines == []
 
+    def test_baselines_listed_once_registry_appears(self, tmp_path: Path) -> None:
+        """Test an empty listing for a missing registry is not cached."""
+        assert list_available_baselines(tmp_path) == []
+        (tmp_path / "registry.json").write_text(
+            json.dumps({"baselines": {"late-baseline": {}}}), encoding="utf-8"
+        )
+        assert list_available_baselines(tmp_path) == ["late-baseline"]
+
 
 # =============================================================================
 # Category 8: Serialization (5 tests)
@@ -556,40 +669,40 @@ class TestErrorHandling:
 class TestSerialization:
     """Tests for serialization."""
 
-    def test_orchestrator_result_json_serializable(self, orchestrator: CounterfactualOrchestrator) -> None:
+    def test_orchestrator_result_json_serializable(
+        self, serialized_result: tuple[OrchestratorResult, dict[str, Any], str]
+    ) -> None:
         """Test result is JSON serializable."""
-        result = orchestrator.run("test-baseline-001", 2, "brightness", "1p0")
-        d = result.to_dict()
-        json_str = json.dumps(d, sort_keys=True)
+        _, _, json_str = serialized_result
         parsed = json.loads(json_str)
         assert parsed["baseline_id"] == "test-baseline-001"
 
-    def test_probe_surface_json_serializable(self, orchestrator: CounterfactualOrchestrator) -> None:
+    def test_probe_surface_json_serializable(
+        self, serialized_result: tuple[OrchestratorResult, dict[str, Any], str]
+    ) -> None:
         """Test probe surface is JSON serializable."""
-        result = orchestrator.run("test-baseline-001", 2, "brightness", "1p0")
-        d = result.probe_surface.to_dict()
-        json_str = json.dumps(d, sort_keys=True)
+        _, d, _ = serialized_result
+        json_str = json.dumps(d["probe_surface"], sort_keys=True)
         parsed = json.loads(json_str)
         assert "results" in parsed
 
-    def test_sorted_keys_in_output(self, orchestrator: CounterfactualOrchestrator) -> None:
+    def test_sorted_keys_in_output(
+        self, serialized_result: tuple[OrchestratorResult, dict[str, Any], str]
+    ) -> None:
         """Test output uses sorted keys."""
-        result = orchestrator.run("test-baseline-001", 2, "brightness", "1p0")
-        d = result.to_dict()
+        _, d, _ = serialized_result
         # Check top-level keys are sorted
         keys = list(d.keys())
         assert keys == sorted(keys)
 
-    def test_metrics_rounded_to_8_decimals(self, orchestrator: CounterfactualOrchestrator) -> None:
+    def test_metrics_rounded_to_8_decimals(
+        self, serialized_result: tuple[OrchestratorResult, dict[str, Any], str]
+    ) -> None:
         """Test metrics are rounded to 8 decimals."""
-        result = orchestrator.run("test-baseline-001", 2, "brightness", "1p0")
+        result, _, _ = serialized_result
         for probe_result in result.probe_surface.results:
-            # Check string representation of floats
-            esi_str = f"{probe_result.delta_esi:.8f}"
-            drift_str = f"{probe_result.delta_drift:.8f}"
-            # Verify round-trip
-            assert float(esi_str) == probe_result.delta_esi
-            assert float(drift_str) == probe_result.delta_drift
+            assert round(probe_result.delta_esi, 8) == probe_result.delta_esi
+            assert round(probe_result.delta_drift, 8) == probe_result.delta_drift
 
     def test_config_json_roundtrip(self) -> None:
         """Test config survives JSON roundtrip."""
@@ -602,43 +715,67 @@ class TestSerialization:
 
 
 # =============================================================================
-# Category 9: Guardrails AST-based (6 tests)
+# Category 9: Guardrails AST-based (3 tests)
 # =============================================================================
 
 
+@pytest.fixture(scope="module")
+def orchestrator_source() -> str:
+    """Load orchestrator module source once for all guardrail tests."""
+    module_path = Path(__file__).parent.parent / "app" / "clarity" / "counterfactual_orchestrator.py"
+    return module_path.read_text(encoding="utf-8")
+
+
+@pytest.fixture(scope="module")
+def orchestrator_tree(orchestrator_source: str) -> ast.Module:
+    """Parse the orchestrator module source once for all guardrail tests."""
+    return ast.parse(orchestrator_source)
+
+
+class _ImportCollector(ast.NodeVisitor):
+    """Collect the module names of every import statement in a tree."""
+
+    def __init__(self) -> None:
+        self.modules: set[str] = set()
+
+    def visit_Import(self, node: ast.Import) -> None:
+        self.modules.update(alias.name for alias in node.names)
+
+    def visit_ImportFrom(self, node: ast.ImportFrom) -> None:
+        self.modules.add(node.module or "")
+
+
+@pytest.fixture(scope="module")
+def orchestrator_imports(orchestrator_tree: ast.Module) -> frozenset[str]:
+    """Imported module names of the orchestrator, collected once."""
+    collector = _ImportCollector()
+    collector.visit(orchestrator_tree)
+    return frozenset(collector.modules)
+
+
+@pytest.fixture(scope="module")
+def orchestrator_nodes(orchestrator_tree: ast.Module) -> tuple[ast.AST, ...]:
+    """Flatten the orchestrator AST once so each guardrail test reuses the walk."""
+    return tuple(ast.walk(orchestrator_tree))
+
+
 class TestGuardrailsAST:
     """AST-based tests to verify no forbidden imports."""
 
-    @pytest.fixture
-    def orchestrator_source(self) -> str:
-        """Load orchestrator module source."""
-        module_path = Path(__file__).parent.parent / "app" / "clarity" / "counterfactual_orchestrator.py"
-        return module_path.read_text(encoding="utf-8")
-
-    def test_no_subprocess_import(self, orchestrator_source: str) -> None:
-        """Test no subprocess import."""
-        tree = ast.parse(orchestrator_source)
-        for node in ast.walk(tree):
-            if isinstance(node, ast.Import):
-                for alias in node.names:
-                    assert alias.name != "subprocess"
-            if isinstance(node, ast.ImportFrom):
-                assert node.module != "subprocess"
-
-    def test_no_random_import(self, orchestrator_source: str) -> None:
-        """Test no random import."""
-        tree = ast.parse(orchestrator_source)
-        for node in ast.walk(tree):
-            if isinstance(node, ast.Import):
-                for alias in node.names:
-                    assert alias.name != "random"
-            if isinstance(node, ast.ImportFrom):
-                assert node.module != "random"
-
-    def test_no_datetime_now(self, orchestrator_source: str) -> None:
+    def test_no_forbidden_tokens(self, orchestrator_source: str) -> None:
+        """Test source has no forbidden import or datetime.now() text (fast pre-check)."""
+        match = _FORBIDDEN_SOURCE_RE.search(orchestrator_source)
+        if match:
+            pytest.fail(f"forbidden token in source: {match.group(0)!r}")
+
+    def test_no_forbidden_imports(self, orchestrator_imports: frozenset[str]) -> None:
+        """Test no subprocess, random, uuid, numpy or direct r2l import."""
+        assert not orchestrator_imports & _FORBIDDEN_MODULES
+        assert not any(module.startswith("r2l") for module in orchestrator_imports)
+
+    def test_no_datetime_now(self, orchestrator_nodes: tuple[ast.AST, ...]) -> None:
         """Test no datetime.now() usage in actual code (not in comments/docstrings)."""
-        tree = ast.parse(orchestrator_source)
-        for node in ast.walk(tree):
+        for node in orchestrator_nodes:
             # Check for datetime.now() or datetime.utcnow() calls
             if isinstance(node, ast.Call):
                 if isinstance(node.func, ast.Attribute):
@@ -650,35 +787,6 @@ class TestGuardrailsAST:
                             if node.func.value.id == "datetime":
                                 pytest.fail("datetime.now() or datetime.utcnow() usage found")
 
-    def test_no_uuid_import(self, orchestrator_source: str) -> None:
-        """Test no uuid import."""
-        tree = ast.parse(orchestrator_source)
-        for node in ast.walk(tree):
-            if isinstance(node, ast.Import):
-                for alias in node.names:
-                    assert alias.name != "uuid"
-            if isinstance(node, ast.ImportFrom):
-                assert node.module != "uuid"
-
-    def test_no_r2l_import(self, orchestrator_source: str) -> None:
-        """Test no direct r2l import."""
-        tree = ast.parse(orchestrator_source)
-        for node in ast.walk(tree):
-            if isinstance(node, ast.ImportFrom):
-                if node.module:
-                    assert not node.module.startswith("r2l")
-
-    def test_no_numpy_import(self, orchestrator_source: str) -> None:
-        """Test no numpy import."""
-        tree = ast.parse(orchestrator_source)
-        for node in ast.walk(tree):
-            if isinstance(node, ast.Import):
-                for alias in node.names:
-                    assert alias.name != "numpy"
-                    assert alias.name != "np"
-            if isinstance(node, ast.ImportFrom):
-                assert node.module != "numpy"
-
 
 # =============================================================================
 # Category 10: M10 Evidence Overlay Integration (12 tests)
@@ -720,42 +828,42 @@ class TestM10EvidenceOverlayIntegration:
         assert r1.evidence_map.values == r2.evidence_map.values
 
     def test_orchestrator_result_has_overlay_bundle(
-        self, orchestrator: CounterfactualOrchestrator
+        self, shared_orchestrator_result: OrchestratorResult
     ) -> None:
         """Test that orchestrator result includes overlay_bundle."""
-        result = orchestrator.run("test-baseline-001", 2, "brightness", "1p0")
+        result = shared_orchestrator_result
         assert result.overlay_bundle is not None
 
     def test_overlay_bundle_has_evidence_map(
-        self, orchestrator: CounterfactualOrchestrator
+        self, shared_orchestrator_result: OrchestratorResult
     ) -> None:
         """Test that overlay bundle has evidence map."""
-        result = orchestrator.run("test-baseline-001", 2, "brightness", "1p0")
+        result = shared_orchestrator_result
         assert result.overlay_bundle.evidence_map is not None
         assert result.overlay_bundle.evidence_map.width == 224
 
     def test_overlay_bundle_has_heatmap(
-        self, orchestrator: CounterfactualOrchestrator
+        self, shared_orchestrator_result: OrchestratorResult
     ) -> None:
         """Test that overlay bundle has normalized heatmap."""
-        result = orchestrator.run("test-baseline-001", 2, "brightness", "1p0")
+        result = shared_orchestrator_result
         assert result.overlay_bundle.heatmap is not None
         # Heatmap should have same dimensions
         assert result.overlay_bundle.heatmap.width == result.overlay_bundle.evidence_map.width
 
     def test_overlay_bundle_has_regions(
-        self, orchestrator: CounterfactualOrchestrator
+        self, shared_orchestrator_result: OrchestratorResult
     ) -> None:
         """Test that overlay bundle has extracted regions."""
-        result = orchestrator.run("test-baseline-001", 2, "brightness", "1p0")
+        result = shared_orchestrator_result
         assert result.overlay_bundle.regions is not None
         assert isinstance(result.overlay_bundle.regions, tuple)
 
     def test_overlay_bundle_in_to_dict(
-        self, orchestrator: CounterfactualOrchestrator
+        self, shared_orchestrator_result: OrchestratorResult
     ) -> None:
         """Test that overlay_bundle is included in to_dict()."""
-        result = orchestrator.run("test-baseline-001", 2, "brightness", "1p0")
+        result = shared_orchestrator_result
         d = result.to_dict()
         assert "overlay_bundle" in d
         assert "evidence_map" in d["overlay_bundle"]
@@ -763,28 +871,24 @@ class TestM10EvidenceOverlayIntegration:
         assert "regions" in d["overlay_bundle"]
 
     def test_overlay_bundle_json_serializable(
-        self, orchestrator: CounterfactualOrchestrator
+        self, shared_orchestrator_result: OrchestratorResult
     ) -> None:
         """Test that overlay_bundle is JSON serializable."""
-        result = orchestrator.run("test-baseline-001", 2, "brightness", "1p0")
+        result = shared_orchestrator_result
         d = result.to_dict()
-        json_str = json.dumps(d["overlay_bundle"], sort_keys=True)
-        parsed = json.loads(json_str)
+        blob = json_codec.dumps(d["overlay_bundle"])
+        parsed = json_codec.loads(blob)
         assert "evidence_map" in parsed
         assert "heatmap" in parsed
         assert "regions" in parsed
 
     def test_overlay_bundle_deterministic(
-        self, orchestrator: CounterfactualOrchestrator
+        self, orchestrator: CounterfactualOrchestrator, reference_dict: dict[str, Any]
     ) -> None:
         """Test that overlay bundle is deterministic across runs."""
-        r1 = orchestrator.run("test-baseline-001", 2, "brightness", "1p0")
-        # Create new orchestrator for fresh run
-        runner2 = StubbedRunner()
-        orch2 = CounterfactualOrchestrator(runner2, FIXTURES_DIR)
-        r2 = orch2.run("test-baseline-001", 2, "brightness", "1p0")
-        # Compare overlay bundles
-        assert r1.overlay_bundle.to_dict() == r2.overlay_bundle.to_dict()
+        result = orchestrator.run("test-baseline-001", 2, "brightness", "1p0")
+        # Compare against the reference run's overlay bundle
+        assert result.overlay_bundle.to_dict() == reference_dict["overlay_bundle"]
 
     def test_runner_custom_evidence_dimensions(
         self, test_image: Image.Image
@@ -802,6 +906,6 @@ class TestM10EvidenceOverlayIntegration:
         """Test that evidence map values are in valid range [0, 1]."""
         result = stubbed_runner.run(test_image, "prompt", "axis", "value", 42)
         assert result.evidence_map is not None
-        for row in result.evidence_map.values:
-            for value in row:
-                assert 0.0 <= value <= 1.0
+        values = np.asarray(result.evidence_map.values, dtype=np.float64)
+        assert float(values.min()) >= 0.0
+        assert float(values.max()) <= 1.0
@@ -15,30 +15,34 @@ Tests cover:
 from __future__ import annotations
 
 import ast
+import functools
 import hashlib
 import json
-import os
-import tempfile
+import shutil
 from pathlib import Path
-from typing import Generator
+from typing import Any, Generator
 
 import pytest
 from fastapi.testclient import TestClient
 
+from app import json_codec
 from app.demo_router import (
     VALID_CASE_ID_PATTERN,
+    CaseListResponse,
+    _expected_checksums,
     _get_artifact_path,
     _load_json_artifact,
     _list_cases,
+    _render_artifact,
+    _sha256_artifact,
     _validate_case_id,
     router,
     verify_artifact_integrity,
 )
-from app.main import app
 
 
-# Test client
-client = TestClient(app)
+# Router module checked by the AST guardrail tests
+_DEMO_ROUTER_PATH = Path(__file__).resolve().parent.parent / "app" / "demo_router.py"
 
 
 # ============================================================================
@@ -46,72 +50,83 @@ client = TestClient(app)
 # ============================================================================
 
 
-@pytest.fixture
-def temp_artifact_dir() -> Generator[Path, None, None]:
-    """Create a temporary artifact directory with test data."""
-    with tempfile.TemporaryDirectory() as tmpdir:
-        artifact_path = Path(tmpdir)
-        
-        # Create case_001
-        case_dir = artifact_path / "case_001"
-        case_dir.mkdir()
-        
-        # Create manifest
-        manifest = {
-            "case_id": "case_001",
-            "title": "Test Case",
-            "description": "Test description",
-            "synthetic": True,
-        }
-        (case_dir / "manifest.json").write_text(json.dumps(manifest))
-        
-        # Create surface
-        surface = {
-            "axes": [],
-            "global_mean_esi": 0.85,
-            "global_mean_drift": 0.1,
-            "_synthetic": True,
-        }
-        (case_dir / "robustness_surface.json").write_text(json.dumps(surface))
-        
-        # Create overlay
-        overlay = {
-            "heatmap": {"width": 224, "height": 224},
-            "regions": [],
-            "_synthetic": True,
-        }
-        (case_dir / "overlay_bundle.json").write_text(json.dumps(overlay))
-        
-        # Create metrics
-        metrics = {
-            "baseline_id": "test",
-            "_synthetic": True,
-        }
-        (case_dir / "metrics.json").write_text(json.dumps(metrics))
-        
-        # Create checksums
-        checksums = {
-            "algorithm": "SHA256",
-            "files": {},
-        }
-        # Compute actual checksums
-        for filename in ["manifest.json", "robustness_surface.json", "overlay_bundle.json", "metrics.json"]:
-            file_path = case_dir / filename
-            sha256 = hashlib.sha256(file_path.read_bytes()).hexdigest().upper()
-            checksums["files"][filename] = sha256
-        (case_dir / "checksums.json").write_text(json.dumps(checksums))
-        
-        # Set environment variable
-        original_root = os.environ.get("ARTIFACT_ROOT")
-        os.environ["ARTIFACT_ROOT"] = str(artifact_path)
-        
+@pytest.fixture(scope="module")
+def temp_artifact_dir(
+    tmp_path_factory: pytest.TempPathFactory,
+) -> Generator[Path, None, None]:
+    """Create a temporary artifact directory with test data.
+
+    Shared by every test in the module; tests that modify artifacts must
+    use writable_artifact_dir instead.
+    """
+    artifact_path = tmp_path_factory.mktemp("artifacts")
+
+    # Create case_001
+    case_dir = artifact_path / "case_001"
+    case_dir.mkdir()
+    
+    # Create manifest
+    manifest = {
+        "case_id": "case_001",
+        "title": "Test Case",
+        "description": "Test description",
+        "synthetic": True,
+    }
+
+    # Create surface
+    surface = {
+        "axes": [],
+        "global_mean_esi": 0.85,
+        "global_mean_drift": 0.1,
+        "_synthetic": True,
+    }
+
+    # Create overlay
+    overlay = {
+        "heatmap": {"width": 224, "height": 224},
+        "regions": [],
+        "_synthetic": True,
+    }
+
+    # Create metrics
+    metrics = {
+        "baseline_id": "test",
+        "_synthetic": True,
+    }
+
+    # Write artifacts, hashing the bytes in hand rather than re-reading them
+    checksums: dict[str, Any] = {
+        "algorithm": "SHA256",
+        "files": {},
+    }
+    artifacts = {
+        "manifest.json": manifest,
+        "robustness_surface.json": surface,
+        "overlay_bundle.json": overlay,
+        "metrics.json": metrics,
+    }
+    for filename, payload in artifacts.items():
+        content = json_codec.dumps(payload)
+        (case_dir / filename).write_bytes(content)
+        checksums["files"][filename] = hashlib.sha256(content).hexdigest().upper()
+    (case_dir / "checksums.json").write_bytes(json_codec.dumps(checksums))
+    
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setenv("ARTIFACT_ROOT", str(artifact_path))
         yield artifact_path
-        
-        # Restore original
-        if original_root:
-            os.environ["ARTIFACT_ROOT"] = original_root
-        else:
-            os.environ.pop("ARTIFACT_ROOT", None)
+    _render_artifact.cache_clear()
+    _expected_checksums.cache_clear()
+
+
+@pytest.fixture
+def writable_artifact_dir(
+    temp_artifact_dir: Path, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> Path:
+    """Return a private copy of the shared artifacts that a test may modify."""
+    artifact_path = tmp_path / "artifacts"
+    shutil.copytree(temp_artifact_dir, artifact_path)
+    monkeypatch.setenv("ARTIFACT_ROOT", str(artifact_path))
+    return artifact_path
 
 
 # ============================================================================
@@ -161,6 +176,13 @@ class TestCaseIdValidation:
         assert exc_info.value.status_code == 400
         assert "Invalid case ID format" in str(exc_info.value.detail)
 
+    def test_invalid_case_id_trailing_newline(self) -> None:
+        """A trailing newline is rejected (regex "$" alone would allow it)."""
+        from fastapi import HTTPException
+        with pytest.raises(HTTPException) as exc_info:
+            _validate_case_id("case_001\n")
+        assert exc_info.value.status_code == 400
+
     def test_case_id_pattern_matches_valid(self) -> None:
         """Pattern correctly matches valid IDs."""
         assert VALID_CASE_ID_PATTERN.match("case_001")
@@ -182,12 +204,12 @@ class TestCaseIdValidation:
 class TestDemoHealthEndpoint:
     """Tests for /demo/health endpoint."""
 
-    def test_demo_health_returns_200(self) -> None:
+    def test_demo_health_returns_200(self, client: TestClient) -> None:
         """Health endpoint returns 200."""
         response = client.get("/demo/health")
         assert response.status_code == 200
 
-    def test_demo_health_contains_mode(self) -> None:
+    def test_demo_health_contains_mode(self, client: TestClient) -> None:
         """Health response contains mode field."""
         response = client.get("/demo/health")
         data = response.json()
@@ -195,7 +217,7 @@ class TestDemoHealthEndpoint:
         assert "status" in data
         assert data["status"] == "ok"
 
-    def test_demo_health_contains_artifact_root(self) -> None:
+    def test_demo_health_contains_artifact_root(self, client: TestClient) -> None:
         """Health response contains artifact_root field."""
         response = client.get("/demo/health")
         data = response.json()
@@ -210,12 +232,12 @@ class TestDemoHealthEndpoint:
 class TestListCasesEndpoint:
     """Tests for /demo/cases endpoint."""
 
-    def test_list_cases_returns_200(self, temp_artifact_dir: Path) -> None:
+    def test_list_cases_returns_200(self, client: TestClient, temp_artifact_dir: Path) -> None:
         """List cases endpoint returns 200."""
         response = client.get("/demo/cases")
         assert response.status_code == 200
 
-    def test_list_cases_contains_case_001(self, temp_artifact_dir: Path) -> None:
+    def test_list_cases_contains_case_001(self, client: TestClient, temp_artifact_dir: Path) -> None:
         """List cases includes case_001."""
         response = client.get("/demo/cases")
         data = response.json()
@@ -226,7 +248,7 @@ class TestListCasesEndpoint:
         case_ids = [c["case_id"] for c in data["cases"]]
         assert "case_001" in case_ids
 
-    def test_list_cases_case_has_required_fields(self, temp_artifact_dir: Path) -> None:
+    def test_list_cases_case_has_required_fields(self, client: TestClient, temp_artifact_dir: Path) -> None:
         """Each case has required fields."""
         response = client.get("/demo/cases")
         data = response.json()
@@ -238,6 +260,38 @@ class TestListCasesEndpoint:
             assert "synthetic" in case
 
 
+    def test_list_cases_rereads_modified_manifest(
+        self, client: TestClient, writable_artifact_dir: Path
+    ) -> None:
+        """Editing a manifest invalidates the cached case list."""
+        assert client.get("/demo/cases").json()["cases"][0]["title"] == "Test Case"
+        manifest_path = writable_artifact_dir / "case_001" / "manifest.json"
+        manifest_path.write_text(json.dumps({"case_id": "case_001", "title": "Renamed case"}))
+        assert client.get("/demo/cases").json()["cases"][0]["title"] == "Renamed case"
+
+    def test_list_cases_skips_dirs_without_manifest(
+        self, client: TestClient, writable_artifact_dir: Path
+    ) -> None:
+        """Directories without a manifest are not listed."""
+        (writable_artifact_dir / "case_002").mkdir()
+        case_ids = [c["case_id"] for c in client.get("/demo/cases").json()["cases"]]
+        assert case_ids == ["case_001"]
+
+    def test_list_cases_body_matches_response_model(
+        self, client: TestClient, writable_artifact_dir: Path
+    ) -> None:
+        """The spliced body is valid CaseListResponse JSON."""
+        (writable_artifact_dir / "case_002").mkdir()
+        (writable_artifact_dir / "case_002" / "manifest.json").write_text(
+            json.dumps({"case_id": "case_002", "title": "Second"})
+        )
+        response = client.get("/demo/cases")
+        assert response.headers["content-type"] == "application/json"
+        parsed = CaseListResponse.model_validate_json(response.content)
+        assert parsed.total == 2
+        assert [c.case_id for c in parsed.cases] == ["case_001", "case_002"]
+
+
 # ============================================================================
 # Test: Get Artifact Endpoints
 # ============================================================================
@@ -246,12 +300,12 @@ class TestListCasesEndpoint:
 class TestGetArtifactEndpoints:
     """Tests for artifact retrieval endpoints."""
 
-    def test_get_manifest_returns_200(self, temp_artifact_dir: Path) -> None:
+    def test_get_manifest_returns_200(self, client: TestClient, temp_artifact_dir: Path) -> None:
         """Get manifest returns 200."""
         response = client.get("/demo/cases/case_001/manifest")
         assert response.status_code == 200
 
-    def test_get_manifest_contains_data(self, temp_artifact_dir: Path) -> None:
+    def test_get_manifest_contains_data(self, client: TestClient, temp_artifact_dir: Path) -> None:
         """Get manifest contains artifact data."""
         response = client.get("/demo/cases/case_001/manifest")
         data = response.json()
@@ -260,31 +314,50 @@ class TestGetArtifactEndpoints:
         assert data["artifact_type"] == "manifest"
         assert "data" in data
 
-    def test_get_surface_returns_200(self, temp_artifact_dir: Path) -> None:
+    def test_get_surface_returns_200(self, client: TestClient, temp_artifact_dir: Path) -> None:
         """Get surface returns 200."""
         response = client.get("/demo/cases/case_001/surface")
         assert response.status_code == 200
 
-    def test_get_overlay_returns_200(self, temp_artifact_dir: Path) -> None:
+    def test_get_overlay_returns_200(self, client: TestClient, temp_artifact_dir: Path) -> None:
         """Get overlay returns 200."""
         response = client.get("/demo/cases/case_001/overlay")
         assert response.status_code == 200
 
-    def test_get_metrics_returns_200(self, temp_artifact_dir: Path) -> None:
+    def test_get_metrics_returns_200(self, client: TestClient, temp_artifact_dir: Path) -> None:
         """Get metrics returns 200."""
         response = client.get("/demo/cases/case_001/metrics")
         assert response.status_code == 200
 
-    def test_get_nonexistent_case_returns_404(self, temp_artifact_dir: Path) -> None:
+    def test_get_nonexistent_case_returns_404(self, client: TestClient, temp_artifact_dir: Path) -> None:
         """Nonexistent case returns 404."""
         response = client.get("/demo/cases/nonexistent_case/manifest")
         assert response.status_code == 404
 
-    def test_get_nonexistent_artifact_returns_404(self, temp_artifact_dir: Path) -> None:
+    def test_get_nonexistent_artifact_returns_404(self, client: TestClient, temp_artifact_dir: Path) -> None:
         """Nonexistent artifact returns 404."""
         response = client.get("/demo/cases/case_001/nonexistent")
         assert response.status_code == 404
 
+    @pytest.mark.parametrize("width", [4, 20_000], ids=["small", "large"])
+    def test_load_json_artifact_sizes(self, writable_artifact_dir: Path, width: int) -> None:
+        """Small and large artifacts round-trip through the loader."""
+        overlay = {"heatmap": {"values": [[0.5] * width]}, "_synthetic": True}
+        (writable_artifact_dir / "case_001" / "overlay_bundle.json").write_bytes(
+            json_codec.dumps(overlay)
+        )
+        assert _load_json_artifact("case_001", "overlay_bundle.json") == overlay
+
+    def test_load_json_artifact_invalid_large_returns_500(self, writable_artifact_dir: Path) -> None:
+        """Invalid JSON in a large artifact is still a 500."""
+        from fastapi import HTTPException
+        (writable_artifact_dir / "case_001" / "overlay_bundle.json").write_bytes(
+            b"{" + b" " * (128 * 1024)
+        )
+        with pytest.raises(HTTPException) as exc_info:
+            _load_json_artifact("case_001", "overlay_bundle.json")
+        assert exc_info.value.status_code == 500
+
 
 # ============================================================================
 # Test: Checksum Verification
@@ -294,23 +367,48 @@ class TestGetArtifactEndpoints:
 class TestChecksumVerification:
     """Tests for artifact integrity verification."""
 
-    def test_get_checksums_returns_200(self, temp_artifact_dir: Path) -> None:
+    def test_get_checksums_returns_200(self, client: TestClient, temp_artifact_dir: Path) -> None:
         """Get checksums returns 200."""
         response = client.get("/demo/cases/case_001/checksums")
         assert response.status_code == 200
 
-    def test_verify_case_returns_valid_true(self, temp_artifact_dir: Path) -> None:
+    def test_get_checksums_body_is_sorted_json(self, client: TestClient, temp_artifact_dir: Path) -> None:
+        """Checksums are served as compact, key-sorted JSON."""
+        response = client.get("/demo/cases/case_001/checksums")
+        assert response.headers["content-type"] == "application/json"
+        assert response.content == json_codec.dumps(response.json())
+
+    def test_verify_case_returns_valid_true(self, client: TestClient, temp_artifact_dir: Path) -> None:
         """Verify case returns valid=true for intact artifacts."""
         response = client.get("/demo/cases/case_001/verify")
         assert response.status_code == 200
         data = response.json()
         assert data["valid"] is True
 
-    def test_verify_case_detects_corruption(self, temp_artifact_dir: Path) -> None:
+    @pytest.mark.parametrize(
+        ("content", "normalized"),
+        [
+            pytest.param(b"", b"", id="empty"),
+            pytest.param(b'{"a": 1}\n', b'{"a": 1}\n', id="lf"),
+            pytest.param(b'{"a": 1}\r\n', b'{"a": 1}\n', id="crlf"),
+        ],
+    )
+    def test_sha256_artifact_normalizes_crlf(
+        self, tmp_path: Path, content: bytes, normalized: bytes
+    ) -> None:
+        """Artifact hashes treat CRLF and LF line endings identically."""
+        file_path = tmp_path / "artifact.json"
+        file_path.write_bytes(content)
+        expected = hashlib.sha256(normalized).hexdigest().upper()
+        assert _sha256_artifact(file_path) == expected
+
+    def test_verify_case_detects_corruption(
+        self, client: TestClient, writable_artifact_dir: Path
+    ) -> None:
         """Verify case detects corrupted artifacts."""
         # Corrupt a file (modify content without updating checksum)
-        manifest_path = temp_artifact_dir / "case_001" / "manifest.json"
-        original_checksum_path = temp_artifact_dir / "case_001" / "checksums.json"
+        manifest_path = writable_artifact_dir / "case_001" / "manifest.json"
+        original_checksum_path = writable_artifact_dir / "case_001" / "checksums.json"
         
         # Read original checksums first
         with open(original_checksum_path, "r") as f:
@@ -328,6 +426,22 @@ class TestChecksumVerification:
         assert data["valid"] is False
         assert data["files"]["manifest.json"] is False
 
+    def test_verify_missing_artifact_is_invalid(self, writable_artifact_dir: Path) -> None:
+        """A file listed in checksums.json but absent on disk fails."""
+        (writable_artifact_dir / "case_001" / "metrics.json").unlink()
+        results = verify_artifact_integrity("case_001")
+        assert results["metrics.json"] is False
+        assert results["manifest.json"] is True
+
+    def test_verify_rereads_modified_checksums(self, writable_artifact_dir: Path) -> None:
+        """Editing checksums.json invalidates the cached expected digests."""
+        assert all(verify_artifact_integrity("case_001").values())
+        checksums_path = writable_artifact_dir / "case_001" / "checksums.json"
+        checksums = json_codec.loads(checksums_path.read_bytes())
+        checksums["files"]["manifest.json"] = "BAD"
+        checksums_path.write_bytes(json_codec.dumps(checksums))
+        assert verify_artifact_integrity("case_001")["manifest.json"] is False
+
 
 # ============================================================================
 # Test: Determinism
@@ -337,14 +451,14 @@ class TestChecksumVerification:
 class TestDeterminism:
     """Tests for response determinism."""
 
-    def test_list_cases_deterministic(self, temp_artifact_dir: Path) -> None:
+    def test_list_cases_deterministic(self, client: TestClient, temp_artifact_dir: Path) -> None:
         """List cases response is deterministic."""
         response1 = client.get("/demo/cases")
         response2 = client.get("/demo/cases")
         
         assert response1.json() == response2.json()
 
-    def test_get_surface_deterministic(self, temp_artifact_dir: Path) -> None:
+    def test_get_surface_deterministic(self, client: TestClient, temp_artifact_dir: Path) -> None:
         """Get surface response is deterministic."""
         response1 = client.get("/demo/cases/case_001/surface")
         response2 = client.get("/demo/cases/case_001/surface")
@@ -355,7 +469,7 @@ class TestDeterminism:
         
         assert hash1 == hash2
 
-    def test_get_overlay_deterministic(self, temp_artifact_dir: Path) -> None:
+    def test_get_overlay_deterministic(self, client: TestClient, temp_artifact_dir: Path) -> None:
         """Get overlay response is deterministic."""
         response1 = client.get("/demo/cases/case_001/overlay")
         response2 = client.get("/demo/cases/case_001/overlay")
@@ -366,52 +480,96 @@ class TestDeterminism:
         assert hash1 == hash2
 
 
+# ============================================================================
+# Test: Artifact Caching
+# ============================================================================
+
+
+class TestArtifactCaching:
+    """Tests for cached artifact bodies and ETag revalidation."""
+
+    def test_get_surface_has_etag(self, client: TestClient, temp_artifact_dir: Path) -> None:
+        """Artifact responses carry an ETag of the body's SHA-256."""
+        response = client.get("/demo/cases/case_001/surface")
+        expected = hashlib.sha256(response.content).hexdigest()
+        assert response.headers["etag"] == f'"{expected}"'
+
+    def test_matching_if_none_match_returns_304(self, client: TestClient, temp_artifact_dir: Path) -> None:
+        """A matching If-None-Match short-circuits with an empty 304."""
+        etag = client.get("/demo/cases/case_001/overlay").headers["etag"]
+        response = client.get(
+            "/demo/cases/case_001/overlay", headers={"If-None-Match": etag}
+        )
+        assert response.status_code == 304
+        assert response.content == b""
+        assert response.headers["etag"] == etag
+
+    def test_stale_if_none_match_returns_200(self, client: TestClient, temp_artifact_dir: Path) -> None:
+        """A non-matching If-None-Match gets the full body."""
+        response = client.get(
+            "/demo/cases/case_001/overlay", headers={"If-None-Match": '"stale"'}
+        )
+        assert response.status_code == 200
+        assert response.json()["artifact_type"] == "overlay_bundle"
+
+    def test_modified_artifact_is_reread(
+        self, client: TestClient, writable_artifact_dir: Path
+    ) -> None:
+        """Editing an artifact on disk invalidates its cached body."""
+        first = client.get("/demo/cases/case_001/metrics")
+        (writable_artifact_dir / "case_001" / "metrics.json").write_text(
+            json.dumps({"baseline_id": "changed", "_synthetic": True, "extra": 1})
+        )
+        second = client.get("/demo/cases/case_001/metrics")
+        assert second.json()["data"]["baseline_id"] == "changed"
+        assert second.headers["etag"] != first.headers["etag"]
+
+
 # ============================================================================
 # Test: AST Guardrails
 # ============================================================================
 
 
+@functools.lru_cache(maxsize=1)
+def _demo_router_source() -> str:
+    """Read demo_router.py once; it cannot change during a test run."""
+    return _DEMO_ROUTER_PATH.read_text(encoding="utf-8")
+
+
+@functools.lru_cache(maxsize=1)
+def _demo_router_tree() -> ast.Module:
+    """Parse demo_router.py once for all guardrail tests."""
+    return ast.parse(_demo_router_source(), filename=str(_DEMO_ROUTER_PATH))
+
+
+@functools.lru_cache(maxsize=1)
+def _demo_router_imports() -> tuple[str, ...]:
+    """Return every module name imported by demo_router.py."""
+    names: list[str] = []
+    for node in ast.walk(_demo_router_tree()):
+        if isinstance(node, ast.Import):
+            names.extend(alias.name for alias in node.names)
+        elif isinstance(node, ast.ImportFrom) and node.module:
+            names.append(node.module)
+    return tuple(names)
+
+
 class TestASTGuardrails:
     """AST-based tests for code safety guardrails."""
 
-    def _get_demo_router_source(self) -> str:
-        """Load demo_router.py source code."""
-        demo_router_path = Path(__file__).parent.parent / "app" / "demo_router.py"
-        return demo_router_path.read_text()
-
     def test_no_r2l_imports(self) -> None:
         """Verify no R2L imports in demo_router."""
-        source = self._get_demo_router_source()
-        tree = ast.parse(source)
-        
-        for node in ast.walk(tree):
-            if isinstance(node, ast.Import):
-                for alias in node.names:
-                    assert "r2l" not in alias.name.lower(), f"R2L import found: {alias.name}"
-            elif isinstance(node, ast.ImportFrom):
-                if node.module:
-                    assert "r2l" not in node.module.lower(), f"R2L import found: {node.module}"
+        found = [name for name in _demo_router_imports() if "r2l" in name.lower()]
+        assert not found, f"R2L import found: {found}"
 
     def test_no_subprocess_imports(self) -> None:
         """Verify no subprocess imports."""
-        source = self._get_demo_router_source()
-        tree = ast.parse(source)
-        
-        for node in ast.walk(tree):
-            if isinstance(node, ast.Import):
-                for alias in node.names:
-                    assert alias.name != "subprocess", "subprocess import found"
-            elif isinstance(node, ast.ImportFrom):
-                if node.module:
-                    assert node.module != "subprocess", "subprocess import found"
+        assert "subprocess" not in _demo_router_imports(), "subprocess import found"
 
     def test_no_write_operations_in_endpoints(self) -> None:
         """Verify endpoints don't perform write operations."""
-        source = self._get_demo_router_source()
-        tree = ast.parse(source)
-        
         # Look for open() calls with write mode
-        for node in ast.walk(tree):
+        for node in ast.walk(_demo_router_tree()):
             if isinstance(node, ast.Call):
                 if isinstance(node.func, ast.Name) and node.func.id == "open":
                     # Check for write modes
@@ -432,17 +590,11 @@ class TestRealArtifacts:
     """Tests using the actual demo_artifacts directory."""
 
     @pytest.fixture
-    def real_artifacts(self) -> Generator[None, None, None]:
+    def real_artifacts(self, monkeypatch: pytest.MonkeyPatch) -> None:
         """Set ARTIFACT_ROOT to the real demo_artifacts directory."""
-        original = os.environ.get("ARTIFACT_ROOT")
-        os.environ["ARTIFACT_ROOT"] = "demo_artifacts"
-        yield
-        if original:
-            os.environ["ARTIFACT_ROOT"] = original
-        else:
-            os.environ.pop("ARTIFACT_ROOT", None)
-
-    def test_real_case_001_exists(self, real_artifacts: None) -> None:
+        monkeypatch.setenv("ARTIFACT_ROOT", "demo_artifacts")
+
+    def test_real_case_001_exists(self, client: TestClient, real_artifacts: None) -> None:
         """Real case_001 exists and can be listed."""
         response = client.get("/demo/cases")
         if response.status_code == 503:
@@ -452,7 +604,7 @@ class TestRealArtifacts:
         case_ids = [c["case_id"] for c in data["cases"]]
         assert "case_001" in case_ids
 
-    def test_real_surface_loads(self, real_artifacts: None) -> None:
+    def test_real_surface_loads(self, client: TestClient, real_artifacts: None) -> None:
         """Real surface artifact loads successfully."""
         response = client.get("/demo/cases/case_001/surface")
         if response.status_code == 503:
@@ -462,7 +614,7 @@ class TestRealArtifacts:
         data = response.json()
         assert data["artifact_type"] == "robustness_surface"
 
-    def test_real_artifacts_verify(self, real_artifacts: None) -> None:
+    def test_real_artifacts_verify(self, client: TestClient, real_artifacts: None) -> None:
         """Real artifacts pass integrity verification."""
         response = client.get("/demo/cases/case_001/verify")
         if response.status_code == 503:
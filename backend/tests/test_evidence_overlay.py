@@ -3,7 +3,7 @@
 This module contains tests for:
 - EvidenceMap creation and validation
 - Heatmap normalization
-- Region extraction via threshold + BFS
+- Region extraction via threshold + run-length labelling
 - OverlayBundle creation
 - Determinism verification
 - Edge cases and error handling
@@ -11,9 +11,11 @@ This module contains tests for:
 """
 
 import ast
+import hashlib
 import math
 from pathlib import Path
 
+import numpy as np
 import pytest
 
 from app.clarity.evidence_overlay import (
@@ -26,6 +28,10 @@ from app.clarity.evidence_overlay import (
     Heatmap,
     OverlayBundle,
     OverlayRegion,
+    _component_bounding_boxes,
+    _pack_array,
+    _round8_array,
+    _stubbed_evidence_map,
     create_overlay_bundle,
     extract_regions_from_heatmap,
     generate_stubbed_evidence_map,
@@ -92,6 +98,32 @@ class TestEvidenceMap:
         with pytest.raises(AttributeError):
             evidence.width = 5  # type: ignore
 
+    def test_evidence_map_as_array_view(self) -> None:
+        """Test that as_array is a read-only row-major view of values."""
+        values = ((0.1, 0.2, 0.3), (0.4, 0.5, 0.6))
+        arr = EvidenceMap(width=3, height=2, values=values).as_array()
+        assert arr.shape == (2, 3)
+        assert arr.tolist() == [list(row) for row in values]
+        with pytest.raises(ValueError):
+            arr[0, 0] = 1.0
+
+    def test_packed_buffer_size_checked(self) -> None:
+        """Test that a packed buffer of the wrong size is rejected."""
+        values = ((0.1, 0.2), (0.3, 0.4))
+        packed = _pack_array(np.array(values))
+        evidence = EvidenceMap(width=2, height=2, values=values, _packed=packed)
+        assert evidence.as_array().tolist() == [list(row) for row in values]
+        with pytest.raises(EvidenceOverlayError, match="Packed buffer size mismatch"):
+            EvidenceMap(width=2, height=2, values=values, _packed=packed[:3])
+        with pytest.raises(EvidenceOverlayError, match="Packed buffer size mismatch"):
+            Heatmap(width=2, height=2, values=values, _packed=packed[:3])
+
+    def test_evidence_map_uses_slots(self) -> None:
+        """Test that EvidenceMap and Heatmap instances carry no __dict__."""
+        values = ((0.1, 0.2), (0.3, 0.4))
+        assert not hasattr(EvidenceMap(width=2, height=2, values=values), "__dict__")
+        assert not hasattr(Heatmap(width=2, height=2, values=values), "__dict__")
+
 
 # =============================================================================
 # Heatmap Tests
@@ -162,6 +194,20 @@ class TestOverlayRegion:
         assert result["area"] == 0.09
         assert result["region_id"] == "evidence_r0"
 
+    def test_overlay_region_uses_slots(self) -> None:
+        """Test that OverlayRegion instances carry no __dict__."""
+        region = OverlayRegion(
+            region_id="evidence_r0",
+            x_min=0.2,
+            y_min=0.3,
+            x_max=0.5,
+            y_max=0.6,
+            area=0.09,
+        )
+        assert not hasattr(region, "__dict__")
+        with pytest.raises(AttributeError):
+            region.area = 1.0  # type: ignore
+
 
 # =============================================================================
 # OverlayBundle Tests
@@ -181,8 +227,8 @@ class TestOverlayBundle:
             heatmap=heatmap,
             regions=regions,
         )
-        assert bundle.evidence_map == evidence
-        assert bundle.heatmap == heatmap
+        assert bundle.evidence_map is evidence
+        assert bundle.heatmap is heatmap
         assert bundle.regions == ()
 
     def test_overlay_bundle_to_dict(self) -> None:
@@ -198,6 +244,8 @@ class TestOverlayBundle:
         assert "evidence_map" in result
         assert "heatmap" in result
         assert "regions" in result
+        rebuilt = create_overlay_bundle(evidence)
+        assert rebuilt.to_dict() == result
         assert result["regions"] == []
 
 
@@ -242,6 +290,12 @@ class TestGenerateStubbedEvidenceMap:
         e2 = generate_stubbed_evidence_map(width=50, height=50, seed=99)
         assert e1.values != e2.values
 
+    def test_seeds_one_period_apart_share_a_map(self) -> None:
+        """Test that seeds 12 apart reuse the same cached map."""
+        e1 = generate_stubbed_evidence_map(width=20, height=20, seed=5)
+        e2 = generate_stubbed_evidence_map(width=20, height=20, seed=17)
+        assert e1 is e2
+
     def test_values_are_8_decimal_rounded(self) -> None:
         """Test that values are rounded to 8 decimals."""
         evidence = generate_stubbed_evidence_map(width=10, height=10, seed=42)
@@ -263,11 +317,8 @@ class TestGenerateStubbedEvidenceMap:
     def test_pattern_has_variation(self) -> None:
         """Test that pattern has meaningful variation (not constant)."""
         evidence = generate_stubbed_evidence_map(width=100, height=100, seed=42)
-        all_values = [v for row in evidence.values for v in row]
-        min_val = min(all_values)
-        max_val = max(all_values)
         # Should have meaningful range
-        assert max_val - min_val > 0.1
+        assert float(np.ptp(np.asarray(evidence.values))) > 0.1
 
 
 # =============================================================================
@@ -278,6 +329,24 @@ class TestGenerateStubbedEvidenceMap:
 class TestNormalizeEvidenceToHeatmap:
     """Tests for normalize_evidence_to_heatmap function."""
 
+    @pytest.mark.parametrize(
+        "values",
+        [
+            pytest.param([0.0, -0.0, 1.0, 0.123456785, 0.5, 1e-9, -5e-9], id="edges"),
+            pytest.param([(k + 0.5) / 1e8 for k in range(0, 10**8, 999_983)], id="ties"),
+            pytest.param([k / 7919 for k in range(-7919, 7920)], id="fractions"),
+            pytest.param([1e12 / 3, -2.0**60, 123456.987654321], id="large"),
+        ],
+    )
+    def test_round8_array_matches_round(self, values: list[float]) -> None:
+        """Test that batched rounding is identical to per-value round()."""
+        rounded = _round8_array(np.array(values)).tolist()
+        expected = [round(v, 8) for v in values]
+        assert rounded == expected
+        assert [math.copysign(1.0, v) for v in rounded] == [
+            math.copysign(1.0, v) for v in expected
+        ]
+
     def test_basic_normalization(self) -> None:
         """Test basic min-max normalization."""
         values = ((0.0, 0.5), (0.5, 1.0))
@@ -300,18 +369,14 @@ class TestNormalizeEvidenceToHeatmap:
         values = ((0.3, 0.5), (0.5, 0.7))
         evidence = EvidenceMap(width=2, height=2, values=values)
         heatmap = normalize_evidence_to_heatmap(evidence)
-        # Find minimum in result
-        min_val = min(v for row in heatmap.values for v in row)
-        assert min_val == 0.0
+        assert float(np.asarray(heatmap.values).min()) == 0.0
 
     def test_normalization_max_becomes_1(self) -> None:
         """Test that maximum value becomes 1."""
         values = ((0.3, 0.5), (0.5, 0.7))
         evidence = EvidenceMap(width=2, height=2, values=values)
         heatmap = normalize_evidence_to_heatmap(evidence)
-        # Find maximum in result
-        max_val = max(v for row in heatmap.values for v in row)
-        assert max_val == 1.0
+        assert float(np.asarray(heatmap.values).max()) == 1.0
 
     def test_constant_values_normalized(self) -> None:
         """Test normalization of constant values."""
@@ -365,6 +430,31 @@ class TestNormalizeEvidenceToHeatmap:
 class TestExtractRegionsFromHeatmap:
     """Tests for extract_regions_from_heatmap function."""
 
+    @pytest.mark.parametrize(
+        ("rows", "expected"),
+        [
+            pytest.param(
+                ["#.#", "#.#", "###"], [(0, 0, 2, 2)], id="u_shape_merges_late"
+            ),
+            pytest.param(
+                ["#.", ".#"], [(0, 0, 0, 0), (1, 1, 1, 1)], id="diagonal_not_connected"
+            ),
+            pytest.param(
+                ["..#", "###", "#.."], [(0, 0, 2, 2)], id="s_shape"
+            ),
+            pytest.param(
+                ["#.#.#", "....."], [(0, 0, 0, 0), (2, 0, 2, 0), (4, 0, 4, 0)], id="row_order"
+            ),
+            pytest.param(["...", "..."], [], id="empty"),
+        ],
+    )
+    def test_component_bounding_boxes(
+        self, rows: list[str], expected: list[tuple[int, int, int, int]]
+    ) -> None:
+        """Test 4-connected labelling and first-pixel ordering."""
+        mask = np.array([[c == "#" for c in row] for row in rows])
+        assert _component_bounding_boxes(mask) == expected
+
     def test_no_regions_below_threshold(self) -> None:
         """Test that values below threshold produce no regions."""
         values = ((0.1, 0.2), (0.3, 0.4))
@@ -491,7 +581,7 @@ class TestCreateOverlayBundle:
         """Test that bundle contains all components."""
         evidence = generate_stubbed_evidence_map(width=50, height=50, seed=42)
         bundle = create_overlay_bundle(evidence)
-        assert bundle.evidence_map == evidence
+        assert bundle.evidence_map is evidence
         assert bundle.heatmap is not None
         assert bundle.regions is not None
 
@@ -510,6 +600,8 @@ class TestCreateOverlayBundle:
         assert "evidence_map" in result
         assert "heatmap" in result
         assert "regions" in result
+        rebuilt = create_overlay_bundle(evidence)
+        assert rebuilt.to_dict() == result
 
 
 # =============================================================================
@@ -547,7 +639,7 @@ class TestEvidenceOverlayEngine:
         engine = EvidenceOverlayEngine()
         evidence = engine.generate_stubbed_evidence(width=50, height=50, seed=42)
         bundle = engine.create_bundle(evidence)
-        assert bundle.evidence_map == evidence
+        assert bundle.evidence_map is evidence
 
 
 # =============================================================================
@@ -555,33 +647,59 @@ class TestEvidenceOverlayEngine:
 # =============================================================================
 
 
+def _digest(value_map: EvidenceMap | Heatmap) -> bytes:
+    """Return a content digest of a map's serialized values."""
+    data = np.asarray(value_map.values, dtype=np.float64).tobytes()
+    return hashlib.blake2b(data, digest_size=16).digest()
+
+
+def _fresh_evidence_100_42() -> EvidenceMap:
+    """Generate the 100x100 seed-42 map, bypassing the generator's cache."""
+    return _stubbed_evidence_map.__wrapped__(100, 100, 42)
+
+
+@pytest.fixture(scope="module")
+def evidence_100_42() -> EvidenceMap:
+    """Return the 100x100 seed-42 stubbed evidence map, generated once."""
+    return generate_stubbed_evidence_map(width=100, height=100, seed=42)
+
+
+@pytest.fixture(scope="module")
+def bundle_100_42(evidence_100_42: EvidenceMap) -> OverlayBundle:
+    """Return the overlay bundle for evidence_100_42, built once."""
+    return create_overlay_bundle(evidence_100_42)
+
+
 class TestDeterminism:
-    """Tests for deterministic behavior."""
+    """Tests for deterministic behavior.
 
-    def test_double_run_equality_evidence_map(self) -> None:
+    Each test compares the shared reference against a map regenerated
+    without the generator's cache, so both runs really compute.
+    """
+
+    def test_double_run_equality_evidence_map(self, evidence_100_42: EvidenceMap) -> None:
         """Test that evidence map generation is deterministic."""
-        e1 = generate_stubbed_evidence_map(width=100, height=100, seed=42)
-        e2 = generate_stubbed_evidence_map(width=100, height=100, seed=42)
-        assert e1.values == e2.values
+        fresh = _fresh_evidence_100_42()
+        assert fresh is not evidence_100_42
+        assert _digest(fresh) == _digest(evidence_100_42)
 
-    def test_double_run_equality_heatmap(self) -> None:
+    def test_double_run_equality_heatmap(self, bundle_100_42: OverlayBundle) -> None:
         """Test that heatmap normalization is deterministic."""
-        e1 = generate_stubbed_evidence_map(width=100, height=100, seed=42)
-        e2 = generate_stubbed_evidence_map(width=100, height=100, seed=42)
-        h1 = normalize_evidence_to_heatmap(e1)
-        h2 = normalize_evidence_to_heatmap(e2)
-        assert h1.values == h2.values
+        h2 = normalize_evidence_to_heatmap(_fresh_evidence_100_42())
+        assert _digest(bundle_100_42.heatmap) == _digest(h2)
+
+    def test_packed_buffers_match_values(self, bundle_100_42: OverlayBundle) -> None:
+        """Test that producer-packed buffers hold exactly the serialized values."""
+        for value_map in (bundle_100_42.evidence_map, bundle_100_42.heatmap):
+            assert value_map.as_array().tolist() == [list(row) for row in value_map.values]
 
-    def test_double_run_equality_regions(self) -> None:
+    def test_double_run_equality_regions(self, bundle_100_42: OverlayBundle) -> None:
         """Test that region extraction is deterministic."""
-        e1 = generate_stubbed_evidence_map(width=100, height=100, seed=42)
-        h1 = normalize_evidence_to_heatmap(e1)
-        r1 = extract_regions_from_heatmap(h1)
-        
-        e2 = generate_stubbed_evidence_map(width=100, height=100, seed=42)
-        h2 = normalize_evidence_to_heatmap(e2)
-        r2 = extract_regions_from_heatmap(h2)
-        
+        r1 = bundle_100_42.regions
+        r2 = extract_regions_from_heatmap(
+            normalize_evidence_to_heatmap(_fresh_evidence_100_42())
+        )
+
         assert len(r1) == len(r2)
         for reg1, reg2 in zip(r1, r2):
             assert reg1.region_id == reg2.region_id
@@ -589,15 +707,10 @@ class TestDeterminism:
             assert reg1.y_min == reg2.y_min
             assert reg1.area == reg2.area
 
-    def test_double_run_equality_bundle(self) -> None:
+    def test_double_run_equality_bundle(self, bundle_100_42: OverlayBundle) -> None:
         """Test that bundle creation is deterministic."""
-        e1 = generate_stubbed_evidence_map(width=100, height=100, seed=42)
-        b1 = create_overlay_bundle(e1)
-        
-        e2 = generate_stubbed_evidence_map(width=100, height=100, seed=42)
-        b2 = create_overlay_bundle(e2)
-        
-        assert b1.to_dict() == b2.to_dict()
+        b2 = create_overlay_bundle(_fresh_evidence_100_42())
+        assert bundle_100_42.to_dict() == b2.to_dict()
 
 
 # =============================================================================
@@ -605,84 +718,88 @@ class TestDeterminism:
 # =============================================================================
 
 
+# Module checked by the AST guardrail tests
+_OVERLAY_PATH = Path(__file__).resolve().parent.parent / "app" / "clarity" / "evidence_overlay.py"
+
+
+@pytest.fixture(scope="module")
+def overlay_ast() -> ast.Module:
+    """Parse evidence_overlay.py once for the guardrail tests."""
+    return ast.parse(_OVERLAY_PATH.read_text(encoding="utf-8"))
+
+
+@pytest.fixture(scope="module")
+def overlay_nodes(overlay_ast: ast.Module) -> dict[type[ast.AST], list[ast.AST]]:
+    """Collect Import, ImportFrom and Call nodes in a single walk."""
+    nodes: dict[type[ast.AST], list[ast.AST]] = {
+        ast.Import: [],
+        ast.ImportFrom: [],
+        ast.Call: [],
+    }
+    for node in ast.walk(overlay_ast):
+        bucket = nodes.get(type(node))
+        if bucket is not None:
+            bucket.append(node)
+    return nodes
+
+
+def _imported_names(nodes: dict[type[ast.AST], list[ast.AST]]) -> list[str]:
+    """Return module names from Import aliases and ImportFrom statements."""
+    names = [alias.name for node in nodes[ast.Import] for alias in node.names]
+    names.extend(node.module for node in nodes[ast.ImportFrom] if node.module)
+    return names
+
+
 class TestASTGuardrails:
     """Tests for forbidden import guardrails."""
 
-    def test_no_subprocess_import(self) -> None:
+    def test_no_subprocess_import(
+        self, overlay_nodes: dict[type[ast.AST], list[ast.AST]]
+    ) -> None:
         """Test that evidence_overlay.py has no subprocess import."""
-        module_path = Path(__file__).parent.parent / "app" / "clarity" / "evidence_overlay.py"
-        with open(module_path, encoding="utf-8") as f:
-            source = f.read()
-        tree = ast.parse(source)
-        
-        for node in ast.walk(tree):
-            if isinstance(node, ast.Import):
-                for alias in node.names:
-                    assert "subprocess" not in alias.name, "subprocess import found"
-            elif isinstance(node, ast.ImportFrom):
-                if node.module:
-                    assert "subprocess" not in node.module, "subprocess import found"
-
-    def test_no_random_import(self) -> None:
+        for name in _imported_names(overlay_nodes):
+            assert "subprocess" not in name, "subprocess import found"
+
+    def test_no_random_import(
+        self, overlay_nodes: dict[type[ast.AST], list[ast.AST]]
+    ) -> None:
         """Test that evidence_overlay.py has no random import."""
-        module_path = Path(__file__).parent.parent / "app" / "clarity" / "evidence_overlay.py"
-        with open(module_path, encoding="utf-8") as f:
-            source = f.read()
-        tree = ast.parse(source)
-        
-        for node in ast.walk(tree):
-            if isinstance(node, ast.Import):
-                for alias in node.names:
-                    assert alias.name != "random", "random import found"
-            elif isinstance(node, ast.ImportFrom):
-                if node.module:
-                    assert "random" not in node.module, "random import found"
-
-    def test_no_uuid_import(self) -> None:
+        for node in overlay_nodes[ast.Import]:
+            for alias in node.names:
+                assert alias.name != "random", "random import found"
+        for node in overlay_nodes[ast.ImportFrom]:
+            if node.module:
+                assert "random" not in node.module, "random import found"
+
+    def test_no_uuid_import(
+        self, overlay_nodes: dict[type[ast.AST], list[ast.AST]]
+    ) -> None:
         """Test that evidence_overlay.py has no uuid import."""
-        module_path = Path(__file__).parent.parent / "app" / "clarity" / "evidence_overlay.py"
-        with open(module_path, encoding="utf-8") as f:
-            source = f.read()
-        tree = ast.parse(source)
-        
-        for node in ast.walk(tree):
-            if isinstance(node, ast.Import):
-                for alias in node.names:
-                    assert alias.name != "uuid", "uuid import found"
-            elif isinstance(node, ast.ImportFrom):
-                if node.module:
-                    assert "uuid" not in node.module, "uuid import found"
-
-    def test_no_datetime_now_usage(self) -> None:
+        for node in overlay_nodes[ast.Import]:
+            for alias in node.names:
+                assert alias.name != "uuid", "uuid import found"
+        for node in overlay_nodes[ast.ImportFrom]:
+            if node.module:
+                assert "uuid" not in node.module, "uuid import found"
+
+    def test_no_datetime_now_usage(
+        self, overlay_nodes: dict[type[ast.AST], list[ast.AST]]
+    ) -> None:
         """Test that evidence_overlay.py has no datetime.now usage in code."""
-        module_path = Path(__file__).parent.parent / "app" / "clarity" / "evidence_overlay.py"
-        with open(module_path, encoding="utf-8") as f:
-            source = f.read()
-        tree = ast.parse(source)
-        
         # Check for datetime.now() or datetime.utcnow() calls
-        for node in ast.walk(tree):
-            if isinstance(node, ast.Call):
-                if isinstance(node.func, ast.Attribute):
-                    if node.func.attr in ("now", "utcnow"):
-                        if isinstance(node.func.value, ast.Name):
-                            if node.func.value.id == "datetime":
-                                pytest.fail("datetime.now() or datetime.utcnow() call found")
-
-    def test_no_r2l_import(self) -> None:
+        for node in overlay_nodes[ast.Call]:
+            if isinstance(node.func, ast.Attribute):
+                if node.func.attr in ("now", "utcnow"):
+                    if isinstance(node.func.value, ast.Name):
+                        if node.func.value.id == "datetime":
+                            pytest.fail("datetime.now() or datetime.utcnow() call found")
+
+    def test_no_r2l_import(
+        self, overlay_nodes: dict[type[ast.AST], list[ast.AST]]
+    ) -> None:
         """Test that evidence_overlay.py has no direct r2l import."""
-        module_path = Path(__file__).parent.parent / "app" / "clarity" / "evidence_overlay.py"
-        with open(module_path, encoding="utf-8") as f:
-            source = f.read()
-        tree = ast.parse(source)
-        
-        for node in ast.walk(tree):
-            if isinstance(node, ast.Import):
-                for alias in node.names:
-                    assert "r2l" not in alias.name.lower(), "r2l import found"
-            elif isinstance(node, ast.ImportFrom):
-                if node.module:
-                    assert "r2l" not in node.module.lower(), "r2l import found"
+        for name in _imported_names(overlay_nodes):
+            assert "r2l" not in name.lower(), "r2l import found"
 
 
 # =============================================================================
@@ -19,6 +19,7 @@ Target: 45-60 tests minimum.
 from __future__ import annotations
 
 import ast
+import functools
 import json
 import math
 from pathlib import Path
@@ -26,6 +27,7 @@ from typing import Any
 
 import pytest
 
+from app import json_codec
 from app.clarity.gradient_engine import (
     AxisGradient,
     GradientComputationError,
@@ -33,6 +35,7 @@ from app.clarity.gradient_engine import (
     GradientPoint,
     GradientSurface,
     _round8,
+    _round8_series,
 )
 from app.clarity.manifest_schema_family import FAMILY_SWEEP_ORCHESTRATOR_V1, MANIFEST_SCHEMA_FAMILY
 from app.clarity.metrics import DriftMetric, ESIMetric, MetricsResult
@@ -114,9 +117,21 @@ def make_surface(
         axes_data: Dict mapping axis name to dict of value -> (esi, drift).
 
     Returns:
-        RobustnessSurface via SurfaceEngine.
+        RobustnessSurface via SurfaceEngine. Surfaces are frozen, so equal
+        specs share one cached instance.
     """
-    metrics = make_metrics(axes_data)
+    spec = tuple(
+        (axis_name, tuple(values.items())) for axis_name, values in sorted(axes_data.items())
+    )
+    return _make_surface_cached(spec)
+
+
+@functools.lru_cache(maxsize=64)
+def _make_surface_cached(
+    spec: tuple[tuple[str, tuple[tuple[str, tuple[float, float]], ...]], ...]
+) -> RobustnessSurface:
+    """Build the surface for a canonical, hashable make_surface spec."""
+    metrics = make_metrics({axis_name: dict(values) for axis_name, values in spec})
     engine = SurfaceEngine()
     return engine.compute(metrics)
 
@@ -492,7 +507,7 @@ class TestDeterminism:
         dict2 = grad.to_dict()
 
         assert dict1 == dict2
-        assert json.dumps(dict1, sort_keys=True) == json.dumps(dict2, sort_keys=True)
+        assert json_codec.dumps(dict1) == json_codec.dumps(dict2)
 
 
 # =============================================================================
@@ -623,6 +638,35 @@ class TestErrorHandling:
         with pytest.raises(GradientComputationError, match="Invalid Drift"):
             engine.compute(bad_surface)
 
+    def test_finite_values_with_overflowing_sum_accepted(
+        self, engine: GradientEngine
+    ) -> None:
+        """Finite values are valid even when their sum overflows."""
+        points = tuple(
+            SurfacePoint(axis="brightness", value=v, esi=1e308, drift=0.1)
+            for v in ("v1", "v2")
+        )
+        surface = RobustnessSurface(
+            axes=(
+                AxisSurface(
+                    axis="brightness",
+                    points=points,
+                    mean_esi=1e308,
+                    mean_drift=0.1,
+                    variance_esi=0.0,
+                    variance_drift=0.0,
+                ),
+            ),
+            global_mean_esi=1e308,
+            global_mean_drift=0.1,
+            global_variance_esi=0.0,
+            global_variance_drift=0.0,
+        )
+
+        grad = engine.compute(surface)
+
+        assert grad.global_max_abs_esi_gradient == 0.0
+
 
 # =============================================================================
 # 6. Rounding Tests
@@ -638,6 +682,11 @@ class TestRounding:
         assert _round8(0.123456781) == 0.12345678
         assert _round8(1.0) == 1.0
 
+    def test_round8_series_matches_round8(self) -> None:
+        """_round8_series rounds each value exactly like _round8."""
+        values = [0.123456789, -0.123456785, 1.0, 0.0, 2.5e-9, 1e12 / 3]
+        assert _round8_series(values) == [_round8(v) for v in values]
+
     def test_gradient_values_rounded(self, engine: GradientEngine) -> None:
         """Gradient values are rounded to 8 decimals."""
         # Create surface that produces non-round gradients
@@ -712,80 +761,57 @@ class TestRounding:
 # =============================================================================
 
 
+# Module checked by the AST guardrail tests
+_GRADIENT_ENGINE_PATH = (
+    Path(__file__).resolve().parent.parent / "app" / "clarity" / "gradient_engine.py"
+)
+
+
+@pytest.fixture(scope="module")
+def gradient_engine_tree() -> ast.Module:
+    """Parse gradient_engine.py once for the guardrail tests."""
+    return ast.parse(_GRADIENT_ENGINE_PATH.read_text(encoding="utf-8"))
+
+
+@pytest.fixture(scope="module")
+def gradient_engine_imports(gradient_engine_tree: ast.Module) -> tuple[str, ...]:
+    """Collect module names from Import and ImportFrom nodes in one walk."""
+    names: list[str] = []
+    for node in ast.walk(gradient_engine_tree):
+        if isinstance(node, ast.Import):
+            names.extend(alias.name for alias in node.names)
+        elif isinstance(node, ast.ImportFrom) and node.module:
+            names.append(node.module)
+    return tuple(names)
+
+
 class TestGuardrails:
     """AST-based tests for forbidden imports."""
 
-    @pytest.fixture
-    def gradient_engine_source(self) -> str:
-        """Load gradient_engine.py source code."""
-        path = Path(__file__).parent.parent / "app" / "clarity" / "gradient_engine.py"
-        return path.read_text(encoding="utf-8")
-
-    def test_no_numpy_import(self, gradient_engine_source: str) -> None:
-        """gradient_engine.py does not import numpy."""
-        tree = ast.parse(gradient_engine_source)
-        for node in ast.walk(tree):
-            if isinstance(node, ast.Import):
-                for alias in node.names:
-                    assert "numpy" not in alias.name
-            elif isinstance(node, ast.ImportFrom):
-                if node.module:
-                    assert "numpy" not in node.module
-
-    def test_no_subprocess_import(self, gradient_engine_source: str) -> None:
-        """gradient_engine.py does not import subprocess."""
-        tree = ast.parse(gradient_engine_source)
-        for node in ast.walk(tree):
-            if isinstance(node, ast.Import):
-                for alias in node.names:
-                    assert "subprocess" not in alias.name
-            elif isinstance(node, ast.ImportFrom):
-                if node.module:
-                    assert "subprocess" not in node.module
-
-    def test_no_random_import(self, gradient_engine_source: str) -> None:
-        """gradient_engine.py does not import random."""
-        tree = ast.parse(gradient_engine_source)
-        for node in ast.walk(tree):
-            if isinstance(node, ast.Import):
-                for alias in node.names:
-                    assert alias.name != "random"
-            elif isinstance(node, ast.ImportFrom):
-                if node.module:
-                    assert node.module != "random"
-
-    def test_no_datetime_import(self, gradient_engine_source: str) -> None:
-        """gradient_engine.py does not import datetime."""
-        tree = ast.parse(gradient_engine_source)
-        for node in ast.walk(tree):
-            if isinstance(node, ast.Import):
-                for alias in node.names:
-                    assert alias.name != "datetime"
-            elif isinstance(node, ast.ImportFrom):
-                if node.module:
-                    assert node.module != "datetime"
-
-    def test_no_uuid_import(self, gradient_engine_source: str) -> None:
-        """gradient_engine.py does not import uuid."""
-        tree = ast.parse(gradient_engine_source)
-        for node in ast.walk(tree):
-            if isinstance(node, ast.Import):
-                for alias in node.names:
-                    assert alias.name != "uuid"
-            elif isinstance(node, ast.ImportFrom):
-                if node.module:
-                    assert node.module != "uuid"
-
-    def test_no_r2l_import(self, gradient_engine_source: str) -> None:
-        """gradient_engine.py does not import r2l."""
-        tree = ast.parse(gradient_engine_source)
-        for node in ast.walk(tree):
-            if isinstance(node, ast.Import):
-                for alias in node.names:
-                    assert "r2l" not in alias.name.lower()
-            elif isinstance(node, ast.ImportFrom):
-                if node.module:
-                    assert "r2l" not in node.module.lower()
+    @pytest.mark.parametrize(
+        ("forbidden", "exact"),
+        [
+            pytest.param("numpy", False, id="numpy"),
+            pytest.param("subprocess", False, id="subprocess"),
+            pytest.param("random", True, id="random"),
+            pytest.param("datetime", True, id="datetime"),
+            pytest.param("uuid", True, id="uuid"),
+            pytest.param("r2l", False, id="r2l"),
+        ],
+    )
+    def test_no_forbidden_import(
+        self, gradient_engine_imports: tuple[str, ...], forbidden: str, exact: bool
+    ) -> None:
+        """gradient_engine.py does not import a forbidden module.
+
+        Exact names are matched whole; the rest also catch submodules and
+        wrappers (e.g. numpy.linalg, r2l_runner).
+        """
+        for name in gradient_engine_imports:
+            if exact:
+                assert name != forbidden, f"{forbidden} import found"
+            else:
+                assert forbidden not in name.lower(), f"{forbidden} import found: {name}"
 
 
 # =============================================================================
@@ -888,9 +914,9 @@ class TestToDict:
         grad = engine.compute(surface)
         d = grad.to_dict()
 
-        # Should not raise
-        json_str = json.dumps(d)
-        assert json_str
+        # Should not raise; round-trips through the app's JSON codec
+        encoded = json_codec.dumps(d)
+        assert json.loads(encoded) == d
 
 
 # =============================================================================
@@ -925,6 +951,12 @@ class TestDataclasses:
         with pytest.raises(AttributeError):
             gp.d_esi = 0.9  # type: ignore
 
+    def test_gradient_point_uses_slots(self) -> None:
+        """GradientPoint instances carry no __dict__."""
+        gp = GradientPoint(axis="b", value="1p0", d_esi=0.5, d_drift=0.1)
+
+        assert not hasattr(gp, "__dict__")
+
     def test_axis_gradient_frozen(self) -> None:
         """AxisGradient is immutable."""
         ag = AxisGradient(
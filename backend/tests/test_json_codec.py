@@ -0,0 +1,54 @@
+"""Tests for json_codec module."""
+
+from __future__ import annotations
+
+import json
+
+import pytest
+
+from app import json_codec
+from app.json_codec import SortedJSONResponse
+
+
+class TestJsonCodec:
+    """Tests for the JSON encode/decode helpers."""
+
+    def test_dumps_sorted_compact(self) -> None:
+        """Output is compact with sorted keys."""
+        assert json_codec.dumps({"b": 1, "a": [1, 2]}) == b'{"a":[1,2],"b":1}'
+
+    def test_dumps_matches_stdlib(self) -> None:
+        """Output matches stdlib json with equivalent options."""
+        obj = {"z": 0.1, "name": "café", "nested": {"y": None, "x": True}}
+        expected = json.dumps(
+            obj, sort_keys=True, separators=(",", ":"), ensure_ascii=False
+        ).encode("utf-8")
+        assert json_codec.dumps(obj) == expected
+
+    def test_dumps_keeps_stdlib_number_spelling(self) -> None:
+        """Small/large floats, NaN and wide ints use stdlib's spelling."""
+        obj = {"small": 1e-05, "tiny": 1e-07, "big": 1e20, "nan": float("nan"), "wide": 2**70}
+        assert json_codec.dumps(obj) == (
+            b'{"big":1e+20,"nan":NaN,"small":1e-05,"tiny":1e-07,'
+            b'"wide":1180591620717411303424}'
+        )
+
+    def test_loads_accepts_bytes_and_str(self) -> None:
+        """Both bytes and str input parse."""
+        assert json_codec.loads(b'{"a": 1}') == {"a": 1}
+        assert json_codec.loads('{"a": 1}') == {"a": 1}
+
+    def test_loads_accepts_memoryview(self) -> None:
+        """A buffer view parses without the caller copying it."""
+        assert json_codec.loads(memoryview(b'{"a": [1, 2]}')) == {"a": [1, 2]}
+
+    def test_loads_invalid_raises_json_decode_error(self) -> None:
+        """Invalid input raises the stdlib-compatible error type."""
+        with pytest.raises(json_codec.JSONDecodeError):
+            json_codec.loads(b"not valid json{")
+
+    def test_sorted_json_response_renders_bytes(self) -> None:
+        """Response body is the dumps() output."""
+        response = SortedJSONResponse({"b": 2, "a": 1})
+        assert response.body == b'{"a":1,"b":2}'
+        assert response.media_type == "application/json"
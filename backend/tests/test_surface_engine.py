@@ -1098,6 +1098,37 @@ class TestDataclasses:
         surfaces = {surface}
         assert len(surfaces) == 1
 
+    def test_axis_surface_value_columns(self) -> None:
+        """Test AxisSurface exposes cached per-point ESI and Drift tuples."""
+        points = (
+            SurfacePoint(axis="a", value="v1", esi=0.5, drift=0.1),
+            SurfacePoint(axis="a", value="v2", esi=0.7, drift=0.3),
+        )
+        surface = AxisSurface(
+            axis="a",
+            points=points,
+            mean_esi=0.6,
+            mean_drift=0.2,
+            variance_esi=0.01,
+            variance_drift=0.01,
+        )
+
+        assert surface.esi_values == (0.5, 0.7)
+        assert surface.drift_values == (0.1, 0.3)
+        assert surface.esi_values is surface.esi_values
+        # Cached columns stay out of equality, hashing and serialization
+        twin = AxisSurface(
+            axis="a",
+            points=points,
+            mean_esi=0.6,
+            mean_drift=0.2,
+            variance_esi=0.01,
+            variance_drift=0.01,
+        )
+        assert surface == twin
+        assert hash(surface) == hash(twin)
+        assert "esi_values" not in surface.to_dict()
+
     def test_robustness_surface_hashable(self, engine: SurfaceEngine) -> None:
         """Test that RobustnessSurface is hashable (frozen)."""
         metrics = make_metrics({"a": {"x": (0.5, 0.1)}})